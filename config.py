@@ -1,14 +1,54 @@
+import os
+import sys
+
 # Basic config
+APP_NAME = "LinkedIn Jobs Scraper"
+APP_VERSION = "1.0.0"
+
+DEFAULT_WINDOW_WIDTH = 1400
+DEFAULT_WINDOW_HEIGHT = 900
+MIN_WINDOW_WIDTH = 1000
+MIN_WINDOW_HEIGHT = 700
+# Pause in typing before the results search re-filters the table
+RESULTS_SEARCH_DEBOUNCE_MS = 150
+
 DEFAULT_REQUEST_DELAY = 2
 MAX_REQUEST_DELAY = 4
+# Navigations allowed back to back before DEFAULT_REQUEST_DELAY pacing applies
+REQUEST_BURST = 3
+REQUEST_JITTER = 0.5
+# Seconds every scraper holds off after LinkedIn shows a wall page
+RATE_LIMIT_COOLDOWN = 60
 PAGE_LOAD_TIMEOUT = 20
+# 'eager' returns from driver.get on DOMContentLoaded; 'none' returns at once
+PAGE_LOAD_STRATEGY = 'eager'
 MAX_RETRY_ATTEMPTS = 2
+# Seconds between condition checks in explicit waits (Selenium defaults to 0.5)
+WAIT_POLL_INTERVAL = 0.1
+# Idle browsers kept warm for reuse by later scrapes
+BROWSER_POOL_SIZE = 2
+# Pooled browsers older than this (seconds) are retired for a fresh session
+BROWSER_MAX_AGE = 3600
+# Parsed search results are reused for this many seconds before scraping again
+CACHE_TTL = 1800
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".linkedin_jobs_scraper", "results_cache.sqlite3")
 
 LINKEDIN_JOBS_BASE_URL = "https://www.linkedin.com/jobs/search"
 
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 ]
 
-JOB_STATUS_OPTIONS = ["Not Reviewed", "Interested", "Applied", "Not Interested"]
\ No newline at end of file
+# Interned so status comparisons across job dicts are pointer checks
+JOB_STATUS_OPTIONS = [sys.intern(s) for s in ("Not Reviewed", "Interested", "Applied", "Not Interested")]
+
+COLORS = {
+    'primary': '#0A66C2',
+    'secondary': '#FFFFFF',
+    'accent': '#004182',
+    'background': '#F3F2EF',
+    'text': '#191919',
+    'border': '#D0D0D0'
+}
@@ -0,0 +1 @@
+from data.job_data_manager import JobDataManager
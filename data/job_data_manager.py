@@ -1,38 +1,330 @@
+from array import array
+from collections import OrderedDict, defaultdict
+from collections.abc import Sequence
 from datetime import datetime
 
+import config
+
+# Jobs are stored column-wise: one list per field, all indexed by row
+JOB_FIELDS = (
+    'id', 'title', 'company', 'location', 'posted_date', 'description',
+    'url', 'job_type', 'experience_level', 'status', 'scraped_at',
+    'status_updated_at'
+)
+
+# Filters matched exactly vs. as case-insensitive substrings; exact
+# matches other than status are answered from per-value row buckets
+CATEGORY_FIELDS = ('job_type', 'experience_level')
+TEXT_FILTER_FIELDS = ('title', 'company', 'location')
+SEARCH_FIELDS = ('title', 'company', 'description')
+LOWERCASE_FIELDS = ('title', 'company', 'location', 'description')
+
+# Number of recent filter results kept by get_filtered_jobs
+FILTER_CACHE_SIZE = 16
+
+TIMESTAMP_FIELDS = ('scraped_at', 'status_updated_at')
+EXPORT_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+class ColumnView(Sequence):
+    # Read-only, live view of one column; status codes are decoded on access
+    __slots__ = ('_col', '_labels')
+
+    def __init__(self, col, labels=None):
+        self._col = col
+        self._labels = labels
+
+    def __len__(self):
+        return len(self._col)
+
+    def __getitem__(self, index):
+        value = self._col[index]
+        if self._labels is None:
+            return value
+        if isinstance(index, slice):
+            return [self._labels[code] for code in value]
+        return self._labels[value]
+
 class JobDataManager:
     def __init__(self):
-        self.jobs = {}
-        self.status_options = ["Not Reviewed", "Interested", "Applied", "Not Interested"]
-        
+        self.status_options = list(config.JOB_STATUS_OPTIONS)
+        # Status is stored as a one-byte code into status_options
+        self._status_to_code = {status: code for code, status in enumerate(self.status_options)}
+        self._status_set = frozenset(self.status_options)
+        self._cols = self._new_columns()
+        # Lowercased copies of the searchable columns, folded once on insert
+        self._lc_cols = {field: [] for field in LOWERCASE_FIELDS}
+        # Export-ready timestamp strings, formatted when the timestamp is set
+        self._time_str_cols = {field: [] for field in TIMESTAMP_FIELDS}
+        self._id_to_row = {}
+        # Lowercased search fields joined per row, so a search is one `in` per row
+        self._search_text = []
+        # Rows bucketed by status so status lookups and counts skip the scan
+        self._by_status = {status: set() for status in self.status_options}
+        self._by_category = {field: defaultdict(set) for field in CATEGORY_FIELDS}
+        # Matching rows per filter combination, dropped on any change
+        self._filter_cache = OrderedDict()
+
     def add_jobs(self, jobs_list):
+        # One timestamp for the whole batch
+        now = datetime.now()
+        now_str = now.strftime(EXPORT_TIME_FORMAT)
+
+        # Jobs already stored are updated in place; new ones are collected
+        # and appended column by column in one go
+        start = len(self._id_to_row)
+        new_ids = []
+        new_jobs = []
         for job in jobs_list:
-            job_id = job.get('id', str(len(self.jobs)))
-            job['status'] = job.get('status', 'Not Reviewed')
-            job['scraped_at'] = datetime.now()
-            self.jobs[job_id] = job
-            
+            job_id = job.get('id', str(len(self._id_to_row)))
+            row = self._id_to_row.get(job_id)
+            if row is None:
+                self._id_to_row[job_id] = start + len(new_jobs)
+                new_ids.append(job_id)
+                new_jobs.append(job)
+            elif row >= start:
+                new_jobs[row - start] = job
+            else:
+                self._insert_job(job, now, now_str)
+        if not new_jobs:
+            return
+
+        codes = []
+        for job in new_jobs:
+            status = job.get('status', 'Not Reviewed')
+            if status not in self._status_to_code:
+                status = 'Not Reviewed'
+            job['status'] = status
+            job['scraped_at'] = now
+            codes.append(self._status_to_code[status])
+
+        for field, col in self._cols.items():
+            if field == 'id':
+                col.extend(new_ids)
+            elif field == 'status':
+                col.extend(codes)
+            else:
+                col.extend(job.get(field, '') for job in new_jobs)
+        for field, col in self._lc_cols.items():
+            col.extend(job.get(field, '').lower() for job in new_jobs)
+        self._time_str_cols['scraped_at'].extend(now_str for _ in new_jobs)
+        self._time_str_cols['status_updated_at'].extend(
+            self._format_time(job.get('status_updated_at', '')) for job in new_jobs)
+
+        for row, job in enumerate(new_jobs, start):
+            self._index_row(row)
+            self._by_status[job['status']].add(row)
+            self._add_categories(row)
+        self._filter_cache.clear()
+
     def add_job(self, job_data):
-        job_id = job_data.get('id', str(len(self.jobs)))
-        job_data['status'] = job_data.get('status', 'Not Reviewed')
-        job_data['scraped_at'] = datetime.now()
-        self.jobs[job_id] = job_data
+        now = datetime.now()
+        return self._insert_job(job_data, now, now.strftime(EXPORT_TIME_FORMAT))
+
+    def _insert_job(self, job_data, scraped_at, scraped_at_str):
+        job_id = job_data.get('id', str(len(self._id_to_row)))
+        status = job_data.get('status', 'Not Reviewed')
+        if status not in self._status_to_code:
+            status = 'Not Reviewed'
+        job_data['status'] = status
+        job_data['scraped_at'] = scraped_at
+
+        values = {field: job_data.get(field, '') for field in JOB_FIELDS}
+        values['status'] = self._status_to_code[status]
+        time_strs = {
+            'scraped_at': scraped_at_str,
+            'status_updated_at': self._format_time(values['status_updated_at']),
+        }
+
+        row = self._id_to_row.get(job_id)
+        old_status = None if row is None else self._status_at(row)
+        if row is None:
+            self._id_to_row[job_id] = len(self._id_to_row)
+            for field, col in self._cols.items():
+                col.append(values[field])
+            for field, col in self._lc_cols.items():
+                col.append(job_data.get(field, '').lower())
+            for field, col in self._time_str_cols.items():
+                col.append(time_strs[field])
+        else:
+            self._drop_categories(row)
+            for field, col in self._cols.items():
+                col[row] = values[field]
+            for field, col in self._lc_cols.items():
+                col[row] = job_data.get(field, '').lower()
+            for field, col in self._time_str_cols.items():
+                col[row] = time_strs[field]
+        row = self._id_to_row[job_id]
+        self._cols['id'][row] = job_id
+        self._index_row(row)
+        self._move_status(row, old_status, status)
+        self._add_categories(row)
+        self._filter_cache.clear()
         return job_id
-        
+
     def update_job_status(self, job_id, status):
-        if job_id in self.jobs and status in self.status_options:
-            self.jobs[job_id]['status'] = status
+        row = self._id_to_row.get(job_id)
+        if row is not None and status in self._status_set:
+            self._move_status(row, self._status_at(row), status)
+            self._cols['status'][row] = self._status_to_code[status]
+            now = datetime.now()
+            self._cols['status_updated_at'][row] = now
+            self._time_str_cols['status_updated_at'][row] = now.strftime(EXPORT_TIME_FORMAT)
+            self._filter_cache.clear()
             return True
         return False
-        
+
     def get_job(self, job_id):
-        return self.jobs.get(job_id)
-        
+        row = self._id_to_row.get(job_id)
+        if row is None:
+            return None
+        return self._row_to_dict(row)
+
+    def get_job_at(self, row):
+        # For views that already hold the row, skipping the id lookup
+        return self._row_to_dict(row)
+
     def get_all_jobs(self):
-        return list(self.jobs.values())
-        
+        return self._rows_to_dicts(range(len(self._id_to_row)))
+
+    def get_column(self, name):
+        labels = self.status_options if name == 'status' else None
+        return ColumnView(self._cols[name], labels)
+
+    def get_filtered_jobs(self, filters):
+        return self._rows_to_dicts(self.get_filtered_rows(filters))
+
+    def get_filtered_rows(self, filters):
+        # Row indexes rather than dicts, for views that read the columns themselves
+        key = tuple(sorted((field, value) for field, value in filters.items() if value))
+        rows = self._filter_cache.get(key)
+        if rows is None:
+            rows = self._filter_rows(filters)
+            self._filter_cache[key] = rows
+            if len(self._filter_cache) > FILTER_CACHE_SIZE:
+                self._filter_cache.popitem(last=False)
+        else:
+            self._filter_cache.move_to_end(key)
+        return rows
+
+    def get_row(self, job_id):
+        return self._id_to_row.get(job_id)
+
+    def search_jobs(self, term):
+        return self.get_filtered_jobs({'search': term})
+
+    def get_status_counts(self):
+        # Every stored status is validated, so the buckets are the counts
+        return {status: len(rows) for status, rows in self._by_status.items()}
+
+    def get_jobs_for_export(self):
+        # Timestamps are read from their preformatted string columns
+        cols = {**self._cols, **self._time_str_cols}
+        jobs = []
+        for row in range(len(self._id_to_row)):
+            job = {field: col[row] for field, col in cols.items()}
+            job['status'] = self.status_options[job['status']]
+            jobs.append(job)
+        return jobs
+
     def get_job_count(self):
-        return len(self.jobs)
-        
-    def clear_jobs(self):
-        self.jobs.clear()
\ No newline at end of file
+        return len(self._id_to_row)
+
+    def replace_jobs(self, jobs_list):
+        # Swap in a new job set as one operation, for views that reload once
+        self.clear_data()
+        self.add_jobs(jobs_list)
+
+    def clear_data(self):
+        # Clear in place so ColumnViews handed out earlier stay live
+        for col in self._cols.values():
+            del col[:]
+        for col in self._lc_cols.values():
+            col.clear()
+        for col in self._time_str_cols.values():
+            col.clear()
+        self._id_to_row.clear()
+        self._search_text.clear()
+        self._by_status = {status: set() for status in self.status_options}
+        for buckets in self._by_category.values():
+            buckets.clear()
+        self._filter_cache.clear()
+
+    def _format_time(self, value):
+        if isinstance(value, datetime):
+            return value.strftime(EXPORT_TIME_FORMAT)
+        return value or ''
+
+    def _new_columns(self):
+        cols = {field: [] for field in JOB_FIELDS}
+        cols['status'] = array('B')
+        return cols
+
+    def _status_at(self, row):
+        return self.status_options[self._cols['status'][row]]
+
+    def _move_status(self, row, old_status, new_status):
+        if old_status is not None:
+            self._by_status[old_status].discard(row)
+        self._by_status[new_status].add(row)
+
+    def _add_categories(self, row):
+        for field, buckets in self._by_category.items():
+            buckets[self._cols[field][row]].add(row)
+
+    def _drop_categories(self, row):
+        for field, buckets in self._by_category.items():
+            value = self._cols[field][row]
+            rows = buckets[value]
+            rows.discard(row)
+            if not rows:
+                del buckets[value]
+
+    def _index_row(self, row):
+        # Newline-joined so a search term can't match across two fields
+        text = '\n'.join(self._lc_cols[field][row] for field in SEARCH_FIELDS)
+        if row < len(self._search_text):
+            self._search_text[row] = text
+        else:
+            self._search_text.append(text)
+
+    def _filter_rows(self, filters):
+        buckets = []
+        status = filters.get('status')
+        if status:
+            buckets.append(self._by_status.get(status, set()))
+        for field in CATEGORY_FIELDS:
+            value = filters.get(field)
+            if value:
+                buckets.append(self._by_category[field].get(value, set()))
+
+        # Exact filters are set intersections, smallest bucket first
+        if buckets:
+            buckets.sort(key=len)
+            rows = buckets[0].intersection(*buckets[1:])
+        else:
+            rows = range(len(self._id_to_row))
+
+        text = [(self._lc_cols[field], filters[field].lower())
+                for field in TEXT_FILTER_FIELDS if filters.get(field)]
+
+        term = filters.get('search')
+        if term:
+            # Checked in the same pass as the field filters
+            text.append((self._search_text, term.lower()))
+
+        # One pass over the remaining rows for every substring check
+        if text:
+            rows = [i for i in rows
+                    if all(value in col[i] for col, value in text)]
+
+        if isinstance(rows, range):
+            return tuple(rows)
+        return tuple(sorted(rows))
+
+    def _row_to_dict(self, row):
+        job = {field: col[row] for field, col in self._cols.items()}
+        job['status'] = self.status_options[job['status']]
+        return job
+
+    def _rows_to_dicts(self, rows):
+        return [self._row_to_dict(i) for i in rows]
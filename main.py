@@ -1,12 +1,21 @@
 import sys
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication
-from ui.main_window import MainWindow
 
 def main():
+    # High-DPI attributes only take effect before the QApplication exists
+    if hasattr(Qt, 'AA_EnableHighDpiScaling'):
+        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    if hasattr(Qt, 'AA_UseHighDpiPixmaps'):
+        QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+
     app = QApplication(sys.argv)
+
+    # Imported after the app is up so the heavy UI module stays off the startup path
+    from ui.main_window import MainWindow
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
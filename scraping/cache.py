@@ -0,0 +1,54 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import config
+
+logger = logging.getLogger(__name__)
+
+class ResultsCache:
+    # Parsed job pages stored as JSON in SQLite, so a repeated search skips the browser
+    def __init__(self, path=config.CACHE_PATH, ttl=config.CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        # One connection, opened on first use and shared by threads under the lock
+        self._conn = None
+        self._lock = threading.Lock()
+        
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS pages (key TEXT PRIMARY KEY, expires REAL, jobs TEXT)")
+        return self._conn
+        
+    def get(self, key):
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute("SELECT expires, jobs FROM pages WHERE key = ?", (json.dumps(key),)).fetchone()
+        except sqlite3.Error:
+            logger.exception("Could not read the results cache")
+            return None
+        # Wall-clock time, since entries outlive the process
+        if not row or row[0] < time.time():
+            return None
+        return json.loads(row[1])
+        
+    def put(self, key, jobs, ttl=None):
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?)",
+                             (json.dumps(key), expires, json.dumps(jobs)))
+                conn.execute("DELETE FROM pages WHERE expires < ?", (time.time(),))
+        except (sqlite3.Error, TypeError, ValueError):
+            logger.exception("Could not write the results cache")
+            
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,50 +1,99 @@
+import hashlib
+import logging
 import re
-from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from datetime import datetime
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+# Prefer lxml's C tokenizer; fall back to the pure-Python parser if it is missing
+try:
+    import lxml
+    PARSER_FEATURES = 'lxml'
+except ImportError:
+    PARSER_FEATURES = 'html.parser'
+
+# Built once at import instead of on every card
+JOB_VIEW_HREF = re.compile(r'/jobs/view/')
+# LinkedIn's own posting id, from the card URN or the trailing digits of the view URL
+JOB_POSTING_URN = re.compile(r'jobPosting:(\d+)')
+JOB_VIEW_ID = re.compile(r'/jobs/view/(?:[^/?#]*-)?(\d+)(?:[/?#]|$)')
+COMPANY_HREF = re.compile(r'/company/')
+JOB_CARD_CLASS = re.compile(r'job', re.IGNORECASE)
+JOB_SEARCH_CARD = soupsieve.compile('.job-search-card')
+
+# Only URN cards (and their subtrees) are built into the tree on the first pass
+URN_CARDS_ONLY = SoupStrainer('div', attrs={'data-entity-urn': True})
+TEXT_TAGS = ['span', 'div']
+WORK_MODE = re.compile(r'remote|hybrid', re.IGNORECASE)
+NOT_LOCATION = re.compile(r'\b(?:ago|today|yesterday|day|week|month|hour|applicant|easy apply|promoted)', re.IGNORECASE)
+RELATIVE_DATE = re.compile(r'\b(?:\d+|an?)\s*(?:second|minute|hour|day|week|month|year)s?\s+ago\b', re.IGNORECASE)
+
+# Elements a single walk over a card collects
+CARD_SLOTS = ('h3', 'h4', 'time', 'job_link', 'job_href', 'company_link', 'location', 'ago_text')
+REQUIRED_SLOTS = ('h3', 'h4', 'time', 'job_link', 'location')
 
 class LinkedInHTMLParser:
     def __init__(self):
         self.base_url = "https://www.linkedin.com"
+        # Companies and locations repeat across a crawl; keep one copy of each
+        self._strpool = {}
     
     def parse_job_listings(self, html_content):
         jobs = []
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Find job cards
-            job_cards = soup.find_all('div', {'data-entity-urn': True}) or \
-                       soup.find_all('li', class_=lambda x: x and 'job' in x.lower()) or \
-                       soup.select('.job-search-card')
+            # Find job cards, building the full tree only if there are no URN cards.
+            # A plain substring check skips the strained pass on pages without any.
+            job_cards = []
+            if 'data-entity-urn' in html_content:
+                soup = BeautifulSoup(html_content, PARSER_FEATURES, parse_only=URN_CARDS_ONLY)
+                job_cards = soup.find_all('div', {'data-entity-urn': True})
+            if not job_cards:
+                soup = BeautifulSoup(html_content, PARSER_FEATURES)
+                job_cards = soup.find_all('li', class_=JOB_CARD_CLASS) or \
+                           JOB_SEARCH_CARD.select(soup)
             
+            # One timestamp for every card on the page, as a plain ISO string
+            scraped_at = datetime.now().isoformat(timespec='seconds')
             for card in job_cards:
-                job = self._extract_job_data(card)
+                job = self._extract_job_data(card, scraped_at)
                 if job:
                     jobs.append(job)
                     
-        except Exception as e:
-            print(f"Error parsing jobs: {e}")
+        except Exception:
+            logger.exception("Error parsing jobs")
             
         return jobs
     
-    def _extract_job_data(self, card):
+    def _extract_job_data(self, card, scraped_at):
         try:
-            # Extract basic info
-            title_elem = card.find('h3') or card.find('a', href=lambda x: x and '/jobs/view/' in x)
-            company_elem = card.find('h4') or card.find('a', href=lambda x: x and '/company/' in x)
+            found = self._scan_card(card)
             
-            if not title_elem or not company_elem:
+            # Extract basic info, giving up on placeholder cards before
+            # any of the other fields are worked out
+            title_elem = found['h3'] or found['job_link']
+            if not title_elem:
+                return None
+            title = self._clean_text(title_elem.get_text(strip=True))
+            if not title:
                 return None
                 
-            title = title_elem.get_text(strip=True)
-            company = company_elem.get_text(strip=True)
+            company_elem = found['h4'] or found['company_link']
+            if not company_elem:
+                return None
+            company = self._clean_text(company_elem.get_text(strip=True))
+            if not company:
+                return None
+            company = self._intern(company)
             
             # Extract other fields
-            location = self._find_location(card)
-            posted_date = self._find_posted_date(card)
-            url = self._find_job_url(card)
+            location = self._intern(self._clean_text(found['location'] or ""))
+            posted_date = self._posted_date(found)
+            url = self._job_url(found['job_href'])
             
             return {
-                'id': str(hash(f"{title}_{company}") % 1000000),
+                'id': self._job_id(card, found['job_href'], title, company, location),
                 'title': title,
                 'company': company,
                 'location': location,
@@ -54,39 +103,83 @@ class LinkedInHTMLParser:
                 'job_type': '',
                 'experience_level': '',
                 'status': 'Not Reviewed',
-                'scraped_at': datetime.now()
+                'scraped_at': scraped_at
             }
             
-        except Exception as e:
-            print(f"Error extracting job data: {e}")
+        except Exception:
+            logger.exception("Error extracting job data")
             return None
     
-    def _find_location(self, card):
-        # Look for location text
-        for elem in card.find_all(['span', 'div']):
-            text = elem.get_text(strip=True)
-            if text and any(word in text.lower() for word in ['remote', 'hybrid']) or \
-               (',' in text and len(text) < 50 and not any(word in text.lower() for word in ['ago', 'day', 'week'])):
-                return text
-        return ""
+    def _clean_text(self, text):
+        # Collapse internal whitespace runs; split() does this in C
+        return ' '.join(text.split())
     
-    def _find_posted_date(self, card):
-        # Look for time elements or "ago" text
-        time_elem = card.find('time')
+    def _intern(self, text):
+        return self._strpool.setdefault(text, text)
+    
+    def clear_strings(self):
+        # The pool only needs to span one crawl; a reused parser would otherwise keep
+        # every company and location it has ever seen
+        self._strpool.clear()
+    
+    def _job_id(self, card, href, title, company, location):
+        match = JOB_POSTING_URN.search(card.get('data-entity-urn') or '')
+        if not match and href:
+            match = JOB_VIEW_ID.search(href)
+        if match:
+            return match.group(1)
+        
+        # Stable across runs, unlike the per-process randomized hash()
+        key = f"{title}|{company}|{location}".encode('utf-8')
+        return hashlib.blake2b(key, digest_size=8).hexdigest()
+    
+    def _scan_card(self, card):
+        # One walk over the card fills every slot, stopping once none are left
+        found = dict.fromkeys(CARD_SLOTS)
+        missing = len(REQUIRED_SLOTS)
+        for elem in card.descendants:
+            name = elem.name
+            if name is None:
+                continue
+            
+            if name in ('h3', 'h4', 'time'):
+                if found[name] is None:
+                    found[name] = elem
+                    missing -= 1
+            elif name == 'a':
+                href = elem.get('href')
+                if href:
+                    if found['job_link'] is None and JOB_VIEW_HREF.search(href):
+                        found['job_link'] = elem
+                        found['job_href'] = href
+                        missing -= 1
+                    if found['company_link'] is None and COMPANY_HREF.search(href):
+                        found['company_link'] = elem
+            elif name in TEXT_TAGS and (found['location'] is None or found['ago_text'] is None):
+                text = elem.get_text(strip=True)
+                if found['location'] is None and self._is_location(text):
+                    found['location'] = text
+                    missing -= 1
+                if found['ago_text'] is None and RELATIVE_DATE.search(text):
+                    found['ago_text'] = text
+            
+            if not missing:
+                break
+        return found
+    
+    def _is_location(self, text):
+        return bool(WORK_MODE.search(text)) or \
+               (',' in text and len(text) < 50 and not NOT_LOCATION.search(text))
+    
+    def _posted_date(self, found):
+        # Prefer time elements over "ago" text
+        time_elem = found['time']
         if time_elem:
             return time_elem.get('datetime', time_elem.get_text(strip=True))
-            
-        for elem in card.find_all(['span', 'div']):
-            text = elem.get_text(strip=True)
-            if 'ago' in text.lower():
-                return text
-        return ""
+        return found['ago_text'] or ""
     
-    def _find_job_url(self, card):
-        # Find job link
-        link = card.find('a', href=lambda x: x and '/jobs/view/' in x)
-        if link:
-            href = link['href']
+    def _job_url(self, href):
+        if href:
             if href.startswith('/'):
                 return f"{self.base_url}{href}"
             return href
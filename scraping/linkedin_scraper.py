@@ -1,76 +1,367 @@
-import time
-import random
+import logging
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from urllib.parse import parse_qs, urlencode, urlparse
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
 from scraping.webdriver_manager import WebDriverManager
 from scraping.html_parser import LinkedInHTMLParser
 
+import config
+
+logger = logging.getLogger(__name__)
+
+RESULTS_LIST = '.jobs-search__results-list'
+
+SEARCH_URL = f"{config.LINKEDIN_JOBS_BASE_URL}/"
+
+# UI filter values -> LinkedIn's f_JT / f_E search URL codes (read-only)
+JOB_TYPE_CODES = MappingProxyType({
+    'Full-time': 'F',
+    'Part-time': 'P',
+    'Contract': 'C',
+    'Temporary': 'T',
+    'Internship': 'I',
+    'Volunteer': 'V',
+})
+EXPERIENCE_CODES = MappingProxyType({
+    'Internship': '1',
+    'Entry': '2',
+    'Mid': '3',
+    'Senior': '4',
+    'Director': '5',
+    'Executive': '6',
+})
+
+# Markup differs between the guest and signed-in pages; every variant goes
+# into one comma-joined query so a lookup is a single WebDriver round trip
+TITLE_INPUT = ', '.join([
+    'input[aria-label*="Search by title"]',
+    'input[name="keywords"]',
+    '#job-search-bar-keywords',
+])
+LOCATION_INPUT = ', '.join([
+    'input[aria-label*="City"]',
+    'input[name="location"]',
+    '#job-search-bar-location',
+])
+NEXT_BUTTON = ', '.join([
+    'button[aria-label="Next"]',
+    'button.artdeco-pagination__button--next',
+])
+# Captcha, challenge and sign-in wall forms; seeing one ends the results wait early
+WALL_ELEMENTS = ', '.join([
+    '#captcha-internal',
+    'form.challenge-form',
+    '[data-test="security-challenge"]',
+    '.authwall-join-form',
+])
+RESULTS_TIMEOUT = 15
+
+# Results per page; LinkedIn pages with the start= offset
+PAGE_SIZE = 25
+
+# Finds the first visible, enabled match in the page itself, so checking
+# candidates costs one execute_script call instead of several per button
+FIND_CLICKABLE_JS = """
+for (const el of document.querySelectorAll(arguments[0])) {
+    const style = getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden') continue;
+    if (el.disabled || (el.className || '').toString().toLowerCase().includes('disabled')) continue;
+    return el;
+}
+return null;
+"""
+
+RESULTS_HTML_JS = "const list = document.querySelector(arguments[0]); return list ? list.outerHTML : null;"
+# Number of cards in the results list, or null when the page has no list at all
+RESULTS_COUNT_JS = "const list = document.querySelector(arguments[0]); return list ? list.querySelectorAll('li').length : null;"
+
 class LinkedInScraper:
-    def __init__(self, headless=True):
-        self.driver_manager = WebDriverManager(headless=headless)
+    def __init__(self, headless=True, keep_alive=True, block_assets=True):
+        self.driver_manager = WebDriverManager(headless=headless, block_assets=block_assets)
         self.parser = LinkedInHTMLParser()
+        # Keep the browser open between searches; cleanup() or the context manager closes it
+        self.keep_alive = keep_alive
+        # True once the last search ran out of pages on its own, rather than failing
+        # or hitting a wall page; only such results are safe to cache
+        self.search_complete = False
+        self._blocked = False
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc, tb):
+        self.cleanup()
         
-    def search_jobs(self, job_title="", location="", max_pages=3):
+    def search_jobs(self, job_title="", location="", job_type="All", experience_level="All", max_pages=3):
+        return [job for jobs in self.iter_search_pages(job_title, location, job_type, experience_level, max_pages)
+                for job in jobs]
+                
+    def iter_search_pages(self, job_title="", location="", job_type="All", experience_level="All", max_pages=3,
+                          max_browsers=1):
+        # Yields each page's new jobs as soon as it is parsed, so callers can show them early
+        self.search_complete = False
+        self._blocked = False
+        self.parser.clear_strings()
         try:
-            print(f"Searching for '{job_title}' in '{location}'...")
-            
-            driver = self.driver_manager.get_driver()
-            
-            # Go to LinkedIn jobs
-            driver.get("https://www.linkedin.com/jobs/search/")
-            time.sleep(random.uniform(2, 4))
+            logger.info("Searching for '%s' in '%s'", job_title, location)
             
-            # Fill search fields
-            if job_title:
-                title_input = self.driver_manager.wait_for_element(By.CSS_SELECTOR, 'input[aria-label*="Search by title"]')
-                if title_input:
-                    title_input.clear()
-                    title_input.send_keys(job_title)
-                    
-            if location:
-                location_input = self.driver_manager.wait_for_element(By.CSS_SELECTOR, 'input[aria-label*="City"]')
-                if location_input:
-                    location_input.clear()
-                    location_input.send_keys(location)
-                    
-            # Submit search
-            if job_title and title_input:
-                title_input.send_keys(Keys.RETURN)
+            url = self._build_search_url(job_title, location, job_type, experience_level)
+            if url and max_browsers > 1 and max_pages > 1:
+                pages = self._iter_pages_parallel(url, max_pages, max_browsers)
+            else:
+                driver = self.driver_manager.get_driver()
+                previous = self._submit_search(driver, job_title, location, job_type, experience_level)
+                self._wait_for_results(driver, previous)
+                pages = self._iter_pages(driver, max_pages)
+                
+            total = 0
+            for jobs in pages:
+                total += len(jobs)
+                yield jobs
+            logger.info("Total jobs found: %d", total)
+            self.search_complete = not self._blocked
             
-            time.sleep(3)
+        except Exception:
+            logger.exception("Error during scraping")
+        finally:
+            if not self.keep_alive:
+                self.cleanup()
+                
+    def _build_search_url(self, job_title, location, job_type="All", experience_level="All"):
+        # None when a filter has no URL code, so the caller falls back to the form
+        params = {}
+        if job_title:
+            params['keywords'] = job_title
+        if location:
+            params['location'] = location
+        if job_type and job_type != "All":
+            if job_type not in JOB_TYPE_CODES:
+                return None
+            params['f_JT'] = JOB_TYPE_CODES[job_type]
+        if experience_level and experience_level != "All":
+            if experience_level not in EXPERIENCE_CODES:
+                return None
+            params['f_E'] = EXPERIENCE_CODES[experience_level]
+        return f"{SEARCH_URL}?{urlencode(params)}"
+        
+    def _submit_search(self, driver, job_title, location, job_type="All", experience_level="All"):
+        # One page load straight to the results when every parameter fits in the URL
+        url = self._build_search_url(job_title, location, job_type, experience_level)
+        self.driver_manager.apply_request_delay()
+        if url:
+            driver.get(url)
+            return None
             
-            # Scrape pages
-            all_jobs = []
+        # Go to LinkedIn jobs
+        driver.get(SEARCH_URL)
+        
+        # Fill search fields; wait_for_element waits for the form to load
+        title_input = None
+        if job_title:
+            title_input = self.driver_manager.wait_for_element(By.CSS_SELECTOR, TITLE_INPUT, clickable=True)
+            if title_input:
+                title_input.clear()
+                title_input.send_keys(job_title)
+                
+        if location:
+            location_input = self.driver_manager.wait_for_element(By.CSS_SELECTOR, LOCATION_INPUT, clickable=True)
+            if location_input:
+                location_input.clear()
+                location_input.send_keys(location)
+                
+        # Submit search; returns the results list it replaces, for _wait_for_results
+        if not title_input:
+            return None
+        previous = self._current_results(driver)
+        title_input.send_keys(Keys.RETURN)
+        return previous
+        
+    def _iter_pages(self, driver, max_pages):
+        # Ids and URLs seen so far in this search, so each page is checked in one pass
+        seen_ids = set()
+        seen_urls = set()
+        last_page_hash = None
+        # Each page is parsed on a worker thread while the browser loads the next one
+        with ThreadPoolExecutor(max_workers=1) as pool:
             for page in range(max_pages):
-                print(f"Scraping page {page + 1}...")
+                logger.debug("Scraping page %d", page + 1)
+                
+                page_source = self._results_html(driver)
+                if page_source is None:
+                    self._blocked = True
+                    break
+                    
+                # Next didn't move us anywhere; don't parse the same page twice
+                page_hash = hash(page_source)
+                if page_hash == last_page_hash:
+                    logger.debug("Page did not change, stopping")
+                    break
+                last_page_hash = page_hash
+                
+                parsing = pool.submit(self.parser.parse_job_listings, page_source)
                 
-                page_source = driver.page_source
-                jobs = self.parser.parse_job_listings(page_source)
+                # Go to next page, unless this one came back short and so was the last
+                has_next = False
+                cards = page_source.count('data-entity-urn')
+                if page < max_pages - 1 and not 0 < cards < PAGE_SIZE:
+                    has_next = self._go_to_next_page(driver)
+                        
+                jobs = parsing.result()
                 
                 if not jobs:
-                    print("No more jobs found")
+                    logger.debug("No more jobs found")
                     break
                     
-                all_jobs.extend(jobs)
-                print(f"Found {len(jobs)} jobs on page {page + 1}")
+                new_jobs = self._new_jobs(jobs, seen_ids, seen_urls)
+                logger.debug("Found %d new jobs on page %d", len(new_jobs), page + 1)
+                if new_jobs:
+                    yield new_jobs
                 
-                # Go to next page
-                if page < max_pages - 1:
-                    next_btn = driver.find_elements(By.CSS_SELECTOR, 'button[aria-label="Next"]')
-                    if next_btn and next_btn[0].is_enabled():
-                        next_btn[0].click()
-                        time.sleep(random.uniform(3, 5))
-                    else:
+                if not has_next:
+                    break
+        
+    def _iter_pages_parallel(self, url, max_pages, max_browsers):
+        # Every page has its own start= URL, so several load at once, one browser each; this
+        # scraper's own browser is one of them and the rest are borrowed from the pool
+        extra = [WebDriverManager(headless=self.driver_manager.headless,
+                                  block_assets=self.driver_manager.block_assets)
+                 for _ in range(max_browsers - 1)]
+        managers = queue.Queue()
+        for manager in [self.driver_manager] + extra:
+            managers.put(manager)
+            
+        seen_ids = set()
+        seen_urls = set()
+        try:
+            with ThreadPoolExecutor(max_workers=max_browsers) as pool:
+                # The first page loads alone: if it comes back short there is nothing to fetch
+                pending = deque([(0, pool.submit(self._fetch_page, managers, url, 0))])
+                next_page = 1
+                while pending:
+                    page, fetching = pending.popleft()
+                    page_source = fetching.result()
+                    if page_source is None:
+                        self._blocked = True
                         break
                         
-            print(f"Total jobs found: {len(all_jobs)}")
-            return all_jobs
-            
-        except Exception as e:
-            print(f"Error during scraping: {e}")
-            return []
+                    # Parsed here, one page at a time, while the pool loads the next ones
+                    jobs = self.parser.parse_job_listings(page_source)
+                    if not jobs:
+                        logger.debug("No more jobs found")
+                        break
+                        
+                    new_jobs = self._new_jobs(jobs, seen_ids, seen_urls)
+                    logger.debug("Found %d new jobs on page %d", len(new_jobs), page + 1)
+                    if new_jobs:
+                        yield new_jobs
+                    if len(jobs) < PAGE_SIZE:
+                        break
+                        
+                    # A full page; keep every browser busy with the pages after it
+                    while next_page < max_pages and len(pending) < max_browsers:
+                        pending.append((next_page, pool.submit(self._fetch_page, managers, url, next_page)))
+                        next_page += 1
+                        
+                # Stopped early; drop the pages that haven't started loading yet
+                for _, fetching in pending:
+                    fetching.cancel()
         finally:
-            self.cleanup()
+            for manager in extra:
+                manager.cleanup()
+                
+    def _fetch_page(self, managers, url, page):
+        # Runs on a pool thread; holds one of the managers, and so one browser, while it loads
+        manager = managers.get()
+        try:
+            driver = manager.get_driver()
+            manager.apply_request_delay()
+            driver.get(f"{url}&start={page * PAGE_SIZE}" if page else url)
+            self._wait_for_results(driver, manager=manager)
+            return self._results_html(driver, manager)
+        finally:
+            managers.put(manager)
+            
+    def _new_jobs(self, jobs, seen_ids, seen_urls):
+        new_jobs = []
+        for job in jobs:
+            job_id, url = job.get('id'), job.get('url')
+            if job_id in seen_ids or (url and url in seen_urls):
+                continue
+            seen_ids.add(job_id)
+            if url:
+                seen_urls.add(url)
+            new_jobs.append(job)
+        return new_jobs
+        
+    def _go_to_next_page(self, driver):
+        previous = self._current_results(driver)
+        
+        # Search result URLs take a start= offset, so jump straight to the next page
+        parts = urlparse(driver.current_url)
+        if parts.path.rstrip('/').endswith('/jobs/search'):
+            query = parse_qs(parts.query)
+            start = int(query.get('start', ['0'])[0] or 0)
+            query['start'] = [str(start + PAGE_SIZE)]
+            self.driver_manager.apply_request_delay()
+            driver.get(parts._replace(query=urlencode(query, doseq=True)).geturl())
+            return self._next_page_loaded(driver, previous)
+            
+        # Otherwise fall back to clicking Next
+        next_btn = driver.execute_script(FIND_CLICKABLE_JS, NEXT_BUTTON)
+        if not next_btn:
+            return False
+        self.driver_manager.apply_request_delay()
+        next_btn.click()
+        return self._next_page_loaded(driver, previous)
+        
+    def _next_page_loaded(self, driver, previous):
+        # Past the last page the results never arrive or the list comes back empty; a page
+        # with no list at all is left to _results_html, which tells wall pages apart
+        if not self._wait_for_results(driver, previous):
+            return False
+        return driver.execute_script(RESULTS_COUNT_JS, RESULTS_LIST) != 0
+        
+    def _results_html(self, driver, manager=None):
+        # Hand the parser just the results list rather than the whole multi-MB page
+        manager = manager or self.driver_manager
+        html = driver.execute_script(RESULTS_HTML_JS, RESULTS_LIST)
+        if html:
+            return html
+            
+        # No results list: a wall page gives itself away in its URL, title, visible
+        # text or challenge form, which is far cheaper to check than the serialized DOM
+        if manager.quick_block_probe(driver, WALL_ELEMENTS):
+            logger.warning("LinkedIn is showing a captcha or sign-in wall, stopping")
+            manager.handle_rate_limiting()
+            return None
+            
+        # Not a wall, just no list (a search with no matches, say); let the parser decide
+        return driver.page_source
+        
+    def _current_results(self, driver):
+        results = driver.find_elements(By.CSS_SELECTOR, RESULTS_LIST)
+        return results[0] if results else None
+        
+    def _wait_for_results(self, driver, previous=None, manager=None):
+        # Proceed as soon as the old results are gone and either the new list or a
+        # wall page is in the DOM; _results_html tells the two apart
+        manager = manager or self.driver_manager
+        try:
+            if previous is not None:
+                manager.wait_for(EC.staleness_of(previous), RESULTS_TIMEOUT)
+            manager.wait_for(EC.any_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, RESULTS_LIST)),
+                EC.presence_of_element_located((By.CSS_SELECTOR, WALL_ELEMENTS)),
+            ), RESULTS_TIMEOUT)
+            return True
+        except TimeoutException:
+            return False
             
     def cleanup(self):
         self.driver_manager.cleanup()
\ No newline at end of file
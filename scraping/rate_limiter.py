@@ -0,0 +1,58 @@
+import random
+import threading
+import time
+
+import config
+
+class TokenBucket:
+    # Caps requests across every thread and browser to rate_per_sec, allowing short bursts
+    def __init__(self, rate_per_sec, burst=1, jitter=0.0):
+        self.rate = rate_per_sec
+        self.burst = burst
+        self.jitter = jitter
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+        
+    def acquire(self):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    self._cond.wait(self._paused_until - now)
+                    continue
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                # Sleep only until the next token is due; other waiters can check meanwhile
+                self._cond.wait((1 - self._tokens) / self.rate)
+                
+        # Keep requests from landing on an exact beat
+        if self.jitter:
+            time.sleep(random.uniform(0, self.jitter))
+            
+    def pause_until(self, deadline):
+        # Backpressure without blocking the caller: later acquires wait out the cooldown
+        with self._cond:
+            self._paused_until = max(self._paused_until, deadline)
+            
+    def paused_for(self):
+        # Seconds left before acquire() stops waiting out a pause, 0 when not paused
+        with self._cond:
+            return max(0.0, self._paused_until - time.monotonic())
+
+class BackoffPolicy:
+    # Exponential backoff schedule; callers decide how to wait out each delay
+    def __init__(self, base, max_attempts, jitter=0.0):
+        self.base = base
+        self.max_attempts = max_attempts
+        self.jitter = jitter
+        
+    def delays(self):
+        for attempt in range(self.max_attempts):
+            yield self.base * (2 ** attempt) + random.uniform(0, self.jitter)
+
+GLOBAL_LIMITER = TokenBucket(1 / config.DEFAULT_REQUEST_DELAY, config.REQUEST_BURST, config.REQUEST_JITTER)
@@ -1,59 +1,287 @@
+import atexit
+import itertools
 import time
 import random
+import re
+import threading
 from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException, WebDriverException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
+from scraping.rate_limiter import GLOBAL_LIMITER, BackoffPolicy
+
+import config
+
+# Assets that never reach the HTML we parse
+BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.mp4', '*.webm', '*.ico',
+    # Logos and media served from LinkedIn's CDN without a file extension
+    '*licdn.com/media/*', '*licdn.com/dms/image/*',
+    '*analytics*', '*doubleclick*', '*linkedin.com/li/track*',
+    # Tracking beacons
+    '*px.ads.linkedin.com*', '*linkedin.com/px*', '*platform.linkedin.com/litrk*', '*liadm*',
+]
+
+# Markers of a captcha, rate-limit or sign-in wall page, checked in one pass against
+# the title and visible text only; scripts and URLs in the HTML mention them too
+BLOCKED_PAGE = re.compile(
+    r'captcha|unusual (?:traffic|activity)|security (?:verification|check)|authwall'
+    r'|too many requests|rate limit|access denied',
+    re.IGNORECASE)
+# A redirect to the sign-in wall or a security challenge shows in the page URL
+WALL_URL = re.compile(r'/(?:authwall|checkpoint/challenge)', re.IGNORECASE)
+
+# Launch flags shared by every browser; only headless, prefs and the user agent vary
+STATIC_CHROME_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+)
+STATIC_EXPERIMENTAL_OPTIONS = (
+    ('excludeSwitches', ['enable-automation']),
+    ('useAutomationExtension', False),
+)
+# Only the DOM text is scraped, so skip decoding images and GPU compositing. Stylesheets
+# still load: the visibility checks on form fields and buttons read computed styles
+LIGHTWEIGHT_CHROME_ARGS = (
+    '--blink-settings=imagesEnabled=false',
+    '--disable-gpu',
+)
+LIGHTWEIGHT_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.managed_default_content_settings.fonts': 2,
+}
+
+# Installed once per browser and run ahead of each page's own scripts
+STEALTH_JS = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
+Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+"""
+
+# Just the title and the start of the visible text, a few KB instead of the whole DOM,
+# plus whether a wall form matching arguments[0] is on the page
+BLOCK_PROBE_JS = """
+const text = document.title + ' ' + (document.body ? document.body.innerText.slice(0, 2000) : '');
+return [text, arguments[0] ? document.querySelector(arguments[0]) !== null : false];
+"""
+
+DEFAULT_WAIT_TIMEOUT = 10
+WAIT_IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+# Shuffled once, then handed out in turn so every agent sees even use
+_USER_AGENTS = itertools.cycle(random.sample(config.USER_AGENTS, len(config.USER_AGENTS)))
+_USER_AGENTS_LOCK = threading.Lock()
+
+def _quit_quietly(driver):
+    # Browsers being thrown away may already be dead; nothing to report either way
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+class _DriverPool:
+    # Idle browsers kept between scrapes, keyed by the settings they were launched with
+    def __init__(self, size):
+        self.size = size
+        self._idle = {}
+        self._lock = threading.Lock()
+        
+    def checkout(self, key):
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                driver, started = idle.pop()
+            # A browser can age out while idle; retire it before it serves a request
+            if self._expired(started):
+                _quit_quietly(driver)
+                continue
+            try:
+                # Make sure the browser is still alive before handing it out
+                driver.window_handles
+                return driver, started
+            except Exception:
+                _quit_quietly(driver)
+                
+    def checkin(self, key, driver, started):
+        # Long-lived sessions are retired rather than reused
+        if self._expired(started):
+            _quit_quietly(driver)
+            return
+        try:
+            # Leave a single blank tab so the next user starts clean
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.get('about:blank')
+        except Exception:
+            _quit_quietly(driver)
+            return
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.size:
+                idle.append((driver, started))
+                return
+        _quit_quietly(driver)
+        
+    def close_all(self):
+        with self._lock:
+            drivers = [driver for idle in self._idle.values() for driver, _ in idle]
+            self._idle.clear()
+        for driver in drivers:
+            _quit_quietly(driver)
+            
+    def _expired(self, started):
+        # Ages use the monotonic clock, so wall-clock jumps don't retire browsers early
+        return time.monotonic() - started > config.BROWSER_MAX_AGE
+
+_POOL = _DriverPool(config.BROWSER_POOL_SIZE)
+atexit.register(_POOL.close_all)
 
 class WebDriverManager:
-    def __init__(self, headless=True):
+    # Resolved once per process; the install step does a network version check
+    _chromedriver_path = None
+    _chromedriver_lock = threading.Lock()
+    
+    def __init__(self, headless=True, block_assets=True):
         self.driver = None
+        # time.monotonic() when the current browser was launched
+        self._started = None
         self.headless = headless
+        self.block_assets = block_assets
+        self.backoff = BackoffPolicy(config.DEFAULT_REQUEST_DELAY, config.MAX_RETRY_ATTEMPTS, config.REQUEST_JITTER)
+        # WebDriverWaits for the current driver, keyed by timeout and built on first use
+        self._waits = {}
         
     def setup_driver(self):
         options = Options()
+        # Results are awaited explicitly, so don't block on slow trailing resources
+        options.page_load_strategy = config.PAGE_LOAD_STRATEGY
         if self.headless:
             options.add_argument('--headless')
             
         # Anti-detection measures
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        # Random user agent
-        user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        ]
-        options.add_argument(f'--user-agent={random.choice(user_agents)}')
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
-        
-        # Hide automation
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        for argument in STATIC_CHROME_ARGS:
+            options.add_argument(argument)
+        for name, value in STATIC_EXPERIMENTAL_OPTIONS:
+            options.add_experimental_option(name, value)
+        
+        if self.block_assets:
+            for argument in LIGHTWEIGHT_CHROME_ARGS:
+                options.add_argument(argument)
+            options.add_experimental_option('prefs', LIGHTWEIGHT_PREFS)
+        
+        # Rotate user agents across browser launches
+        with _USER_AGENTS_LOCK:
+            user_agent = next(_USER_AGENTS)
+        options.add_argument(f'--user-agent={user_agent}')
+        
+        service = Service(self._driver_path())
+        # Every WebDriver command is an HTTP call to chromedriver; reuse the connection.
+        # Each driver has its own connection pool and is driven from one thread at a time,
+        # so pooled browsers never contend for a connection
+        self.driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
+        self._started = time.monotonic()
+        # No implicit wait: lookups that find nothing must return immediately
+        
+        # Hide automation before any page script runs, on every document
+        self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': STEALTH_JS})
+        
+        # Drop images, fonts, media and trackers before they are requested
+        if self.block_assets:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
         
         return self.driver
         
+    @classmethod
+    def _driver_path(cls):
+        with cls._chromedriver_lock:
+            if cls._chromedriver_path is None:
+                cls._chromedriver_path = ChromeDriverManager().install()
+            return cls._chromedriver_path
+            
     def get_driver(self):
         if not self.driver:
-            self.setup_driver()
+            # Reuse a warm browser from the pool before starting a new one
+            pooled = _POOL.checkout(self._pool_key())
+            if pooled:
+                self.driver, self._started = pooled
+            else:
+                self._launch()
         return self.driver
         
-    def wait_for_element(self, by, value, timeout=10):
+    def _launch(self):
+        # Browser start-up fails transiently (ports, a slow chromedriver); back off and retry
+        for delay in self.backoff.delays():
+            try:
+                return self.setup_driver()
+            except WebDriverException:
+                # Don't leak a browser that started but failed during setup
+                if self.driver:
+                    _quit_quietly(self.driver)
+                    self.driver = None
+                time.sleep(delay)
+        return self.setup_driver()
+        
+    def _pool_key(self):
+        return (self.headless, self.block_assets)
+        
+    def apply_request_delay(self):
+        # Shared by every driver, so concurrent scrapes pipeline under one rate cap
+        GLOBAL_LIMITER.acquire()
+        
+    def handle_rate_limiting(self):
+        # Other scrapers back off on their next request; this thread carries on
+        GLOBAL_LIMITER.pause_until(time.monotonic() + config.RATE_LIMIT_COOLDOWN)
+        
+    def cooldown_remaining(self):
+        # How long the next request will wait out a rate-limit pause, so callers can say so
+        return GLOBAL_LIMITER.paused_for()
+        
+    def wait_for(self, condition, timeout=DEFAULT_WAIT_TIMEOUT):
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = self._new_wait(timeout)
+        return wait.until(condition)
+        
+    def _new_wait(self, timeout):
+        return WebDriverWait(self.driver, timeout, poll_frequency=config.WAIT_POLL_INTERVAL,
+                             ignored_exceptions=WAIT_IGNORED_EXCEPTIONS)
+        
+    def wait_for_element(self, by, value, timeout=DEFAULT_WAIT_TIMEOUT, clickable=False):
+        # The locator is re-resolved on every poll and stale hits are ignored, so a
+        # re-rendered element is picked up within the same wait
+        condition = EC.element_to_be_clickable if clickable else EC.presence_of_element_located
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            return wait.until(EC.presence_of_element_located((by, value)))
-        except:
+            return self.wait_for(condition((by, value)), timeout)
+        except TimeoutException:
             return None
             
+    def is_blocked_or_captcha(self, visible_text):
+        return bool(visible_text) and BLOCKED_PAGE.search(visible_text) is not None
+        
+    def quick_block_probe(self, driver=None, wall_selector=None):
+        # Judged on what the page shows: the URL it landed on, its title and visible
+        # text, or a wall form; never on strings inside its scripts or links
+        driver = driver or self.driver
+        if WALL_URL.search(driver.current_url or ''):
+            return True
+        text, has_wall_form = driver.execute_script(BLOCK_PROBE_JS, wall_selector)
+        return has_wall_form or self.is_blocked_or_captcha(text)
+            
     def cleanup(self):
+        # The browser goes back to the pool; it is quit when the pool is full or at exit
         if self.driver:
-            self.driver.quit()
-            self.driver = None
\ No newline at end of file
+            _POOL.checkin(self._pool_key(), self.driver, self._started)
+            self.driver = None
+            self._waits.clear()
\ No newline at end of file
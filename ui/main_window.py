@@ -3,58 +3,167 @@ LinkedIn Job Scraper - Main Window
 Main application window with professional UI layout
 """
 
+import math
+import os
 import sys
+import time
+from string import Template
+from types import MappingProxyType
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QFrame, QStatusBar, QSplitter, QLineEdit,
-    QComboBox, QPushButton, QGridLayout, QTableWidget,
-    QTableWidgetItem, QHeaderView, QDialog, QTextEdit,
-    QScrollArea, QProgressBar, QMessageBox
+    QComboBox, QPushButton, QGridLayout, QTableView,
+    QHeaderView, QDialog, QTextEdit,
+    QScrollArea, QProgressBar, QMessageBox, QStyledItemDelegate,
+    QApplication, QStyle, QStyleOption
+)
+from PyQt5.QtCore import (
+    Qt, QSize, QUrl, QRect, QThread, QTimer, pyqtSignal, pyqtSlot,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QStringListModel
 )
-from PyQt5.QtCore import Qt, QSize, QUrl, QThread, pyqtSignal
 from PyQt5.QtGui import QFont, QPalette, QColor, QDesktopServices
 
 import config
 from data import JobDataManager
+from scraping.cache import ResultsCache
 from scraping.linkedin_scraper import LinkedInScraper
 
+# Minimum seconds between progress updates sent from the scraping thread
+PROGRESS_INTERVAL = 0.1
+
+STYLES_DIR = os.path.join(os.path.dirname(__file__), "styles")
+
+
+def _load_stylesheet(name):
+    """Fill a stylesheet template from ui/styles with the theme colors"""
+    with open(os.path.join(STYLES_DIR, name), encoding="utf-8") as f:
+        return Template(f.read()).substitute(config.COLORS)
+
+
+# Built once at import; the window and every dialog reuse the same strings
+MAIN_STYLESHEET = _load_stylesheet("main.qss.tmpl")
+DIALOG_STYLESHEET = _load_stylesheet("dialog.qss.tmpl")
+
+# Description characters laid out when the details dialog opens; the rest loads on scroll
+DESCRIPTION_PREVIEW_CHARS = 8000
+
+# Demo jobs for add_sample_data; read-only, and copied before the data manager fills them in
+SAMPLE_JOBS = (
+    MappingProxyType({
+        'id': 'job_1',
+        'title': 'Senior Software Engineer',
+        'company': 'Tech Corp',
+        'location': 'San Francisco, CA',
+        'posted_date': '2 days ago',
+        'status': 'Not Reviewed',
+        'description': 'We are looking for a senior software engineer...',
+        'url': 'https://linkedin.com/jobs/sample1'
+    }),
+    MappingProxyType({
+        'id': 'job_2', 
+        'title': 'Data Scientist',
+        'company': 'Analytics Inc',
+        'location': 'New York, NY',
+        'posted_date': '1 week ago',
+        'status': 'Interested',
+        'description': 'Join our data science team...',
+        'url': 'https://linkedin.com/jobs/sample2'
+    }),
+    MappingProxyType({
+        'id': 'job_3',
+        'title': 'Product Manager',
+        'company': 'StartupXYZ',
+        'location': 'Remote',
+        'posted_date': '3 days ago', 
+        'status': 'Applied',
+        'description': 'Lead product development...',
+        'url': 'https://linkedin.com/jobs/sample3'
+    }),
+)
+
 
 class ScrapingWorker(QThread):
     """Worker thread for scraping operations to prevent UI blocking"""
     
     # Signals for communication with main thread
-    progress_update = pyqtSignal(str)  # Status message
-    progress_percentage = pyqtSignal(int)  # Progress percentage (0-100)
-    jobs_found = pyqtSignal(list)     # List of jobs found
+    progress = pyqtSignal(int, str)  # Progress percentage (0-100), status message
+    jobs_found = pyqtSignal(list)     # Jobs found on one results page
     scraping_finished = pyqtSignal(bool, str)  # Success status and message
-    page_progress = pyqtSignal(int, int)  # Current page, total pages
     
-    def __init__(self, job_title, location, job_type, experience_level, max_pages=3):
+    def __init__(self, job_title, location, job_type, experience_level, max_pages=3, scraper=None, cache=None):
         super().__init__()
         self.job_title = job_title
         self.location = location
         self.job_type = job_type
         self.experience_level = experience_level
         self.max_pages = max_pages
-        self.scraper = None
+        # Owned by the main window and reused across searches; its browser only
+        # starts on first use, inside run()
+        self.scraper = scraper
+        # Parsed pages from recent searches; None disables caching
+        self.cache = cache
+        # When progress was last sent, so bursts of updates cross threads only once
+        self._last_progress = 0.0
+        
+    def report_progress(self, percentage, message, force=False):
+        """Send progress to the window, dropping updates less than 100 ms apart"""
+        now = time.monotonic()
+        if force or now - self._last_progress >= PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.progress.emit(percentage, message)
+        
+    def page_key(self, page):
+        """Cache key for one results page of this search"""
+        return (self.job_title, self.location, self.job_type, self.experience_level, page)
+        
+    def cached_pages(self):
+        """Return every page of this search from the cache, or None if any is missing"""
+        if self.cache is None:
+            return None
+        pages = []
+        for page in range(1, self.max_pages + 1):
+            jobs = self.cache.get(self.page_key(page))
+            if jobs is None:
+                return None
+            # An empty entry marks where the search ran out of results
+            if not jobs:
+                break
+            pages.append(jobs)
+        return pages
+        
+    def store_pages(self, pages):
+        """Cache each scraped page, plus an end marker if the search stopped early"""
+        for page, jobs in enumerate(pages, 1):
+            self.cache.put(self.page_key(page), jobs)
+        if len(pages) < self.max_pages:
+            self.cache.put(self.page_key(len(pages) + 1), [])
+        
+    def wait_out_cooldown(self, resume_message):
+        """Count down a rate-limit pause left by an earlier wall page before scraping"""
+        remaining = self.scraper.driver_manager.cooldown_remaining()
+        if not remaining:
+            return
+        while remaining > 0:
+            self.report_progress(35, f"LinkedIn asked us to slow down; searching again in {math.ceil(remaining)}s...",
+                                 force=True)
+            time.sleep(min(1.0, remaining))
+            remaining = self.scraper.driver_manager.cooldown_remaining()
+        self.report_progress(35, resume_message, force=True)
         
     def run(self):
         """Run the scraping operation in background thread"""
         try:
             # Phase 1: Initialization (0-10%)
-            self.progress_update.emit("Initializing web scraper...")
-            self.progress_percentage.emit(5)
+            self.report_progress(5, "Initializing web scraper...")
             
-            # Create scraper instance
-            self.scraper = LinkedInScraper(headless=True)
+            # A recent identical search is answered from the cache without a browser
+            cached = self.cached_pages()
             
             # Phase 2: Connection (10-20%)
-            self.progress_update.emit("Connecting to LinkedIn...")
-            self.progress_percentage.emit(15)
+            self.report_progress(15, "Connecting to LinkedIn...")
             
             # Phase 3: Navigation (20-30%)
-            self.progress_update.emit("Navigating to LinkedIn jobs page...")
-            self.progress_percentage.emit(25)
+            self.report_progress(25, "Navigating to LinkedIn jobs page...")
             
             # Phase 4: Search setup (30-40%)
             search_params = []
@@ -66,36 +175,51 @@ class ScrapingWorker(QThread):
                 search_params.append(f"({self.job_type})")
             
             search_description = " ".join(search_params) if search_params else "all jobs"
-            self.progress_update.emit(f"Searching for {search_description}...")
-            self.progress_percentage.emit(35)
-            
-            # Phase 5: Actual scraping (40-90%)
-            jobs = self.scraper.search_jobs(
-                job_title=self.job_title,
-                location=self.location,
-                job_type=self.job_type,
-                experience_level=self.experience_level,
-                max_pages=self.max_pages
-            )
-            
-            # Phase 6: Processing results (90-100%)
-            if jobs:
-                self.progress_update.emit(f"Processing {len(jobs)} job listings...")
-                self.progress_percentage.emit(95)
+            # Always shown: it stays up while the first page loads
+            self.report_progress(35, f"Searching for {search_description}...", force=True)
+            
+            # Phase 5: Actual scraping (40-90%), handing over each page as it is parsed
+            total_jobs = 0
+            scraped = []
+            if cached is not None:
+                pages = cached
+            else:
+                self.wait_out_cooldown(f"Searching for {search_description}...")
+                pages = self.scraper.iter_search_pages(
+                    job_title=self.job_title,
+                    location=self.location,
+                    job_type=self.job_type,
+                    experience_level=self.experience_level,
+                    max_pages=self.max_pages,
+                    max_browsers=config.BROWSER_POOL_SIZE
+                )
+            for page, jobs in enumerate(pages, 1):
+                total_jobs += len(jobs)
+                # Copied before the data manager adds its own fields to the dicts
+                if cached is None:
+                    scraped.append([dict(job) for job in jobs])
                 self.jobs_found.emit(jobs)
-                self.progress_percentage.emit(100)
-                self.scraping_finished.emit(True, f"Successfully found {len(jobs)} jobs")
+                self.report_progress(40 + 50 * page // self.max_pages,
+                                     f"Found {total_jobs} jobs so far (page {page} of {self.max_pages})...")
+            
+            # Only searches that ran out of pages on their own are cached; one cut short by
+            # an error or a wall page is scraped again next time
+            if scraped and self.cache is not None and self.scraper.search_complete:
+                self.store_pages(scraped)
+            
+            # Phase 6: Done (100%)
+            self.report_progress(100, f"Found {total_jobs} jobs", force=True)
+            if total_jobs:
+                self.scraping_finished.emit(True, f"Successfully found {total_jobs} jobs")
             else:
-                self.progress_percentage.emit(100)
                 self.scraping_finished.emit(False, "No jobs found matching your criteria. Try different search terms or check your internet connection.")
                 
         except Exception as e:
             error_msg = f"Scraping failed: {str(e)}"
             print(f"Scraping error details: {error_msg}")
-            self.progress_percentage.emit(0)
+            self.report_progress(0, error_msg, force=True)
             self.scraping_finished.emit(False, error_msg)
-        finally:
-            # Clean up scraper resources
+            # Release the browser after a failure; the next search gets a checked one
             if self.scraper:
                 try:
                     self.scraper.cleanup()
@@ -103,6 +227,172 @@ class ScrapingWorker(QThread):
                     print(f"Error during cleanup: {cleanup_error}")
 
 
+class StatusDelegate(QStyledItemDelegate):
+    """Status column editor: one transient dropdown instead of a combo box per row"""
+    
+    def __init__(self, status_options, parent=None):
+        super().__init__(parent)
+        self.status_options = status_options
+        # One list model shared by every dropdown the delegate opens
+        self.status_model = QStringListModel(status_options, self)
+        # Dropdown row of each status, so opening an editor needs no text search
+        self.status_index = {status: i for i, status in enumerate(status_options)}
+        
+    def createEditor(self, parent, option, index):
+        """Create the dropdown shown while a status cell is being edited"""
+        editor = QComboBox(parent)
+        editor.setObjectName("statusCombo")
+        editor.setModel(self.status_model)
+        # Apply the choice as soon as it is picked
+        editor.activated.connect(self.commit_and_close)
+        return editor
+        
+    @pyqtSlot()
+    def commit_and_close(self):
+        """Write the picked status back and close the dropdown"""
+        editor = self.sender()
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+        
+    def setEditorData(self, editor, index):
+        """Select the cell's current status in the dropdown"""
+        editor.setCurrentIndex(self.status_index.get(index.data(Qt.EditRole), -1))
+        
+    def setModelData(self, editor, model, index):
+        """Write the new status to the model, which stores it in the data manager"""
+        status = editor.currentText()
+        if status != index.data(Qt.EditRole):
+            model.setData(index, status, Qt.EditRole)
+            
+    def paint(self, painter, option, index):
+        """Draw the status text with a dropdown arrow showing it can be changed"""
+        super().paint(painter, option, index)
+        arrow = QStyleOption()
+        arrow.palette = option.palette
+        arrow.state = option.state
+        arrow.rect = QRect(option.rect.right() - 16, option.rect.center().y() - 4, 8, 8)
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_IndicatorArrowDown, arrow, painter, option.widget)
+
+
+class JobsTableModel(QAbstractTableModel):
+    """Table model that reads jobs straight from the data manager's columns"""
+    
+    status_changed = pyqtSignal(object, str)  # Job id, new status
+    
+    COLUMNS = (
+        ('title', "Job Title"),
+        ('company', "Company"),
+        ('location', "Location"),
+        ('posted_date', "Posted Date"),
+        ('status', "Status"),
+    )
+    STATUS_COLUMN = 4
+    # Every cell answers this role with its row's job id, so no row-to-id map is kept
+    JOB_ID_ROLE = Qt.UserRole
+    # The whole job as a dict, built from the row when asked for, so it is never stale
+    JOB_ROLE = Qt.UserRole + 1
+    
+    def __init__(self, data_manager, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        # Live column views: cells are read on demand and never copied
+        self._columns = [data_manager.get_column(field) for field, _ in self.COLUMNS]
+        self._ids = data_manager.get_column('id')
+        self._row_count = 0
+        
+    def rowCount(self, parent=QModelIndex()):
+        """Number of jobs the view has been told about"""
+        return 0 if parent.isValid() else self._row_count
+        
+    def columnCount(self, parent=QModelIndex()):
+        """Number of displayed job fields"""
+        return 0 if parent.isValid() else len(self.COLUMNS)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        """Cell text, the job id under JOB_ID_ROLE or the job under JOB_ROLE"""
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._columns[index.column()][index.row()]
+        if role == self.JOB_ID_ROLE:
+            return self._ids[index.row()]
+        if role == self.JOB_ROLE:
+            return self.data_manager.get_job_at(index.row())
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Column titles"""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][1]
+        return super().headerData(section, orientation, role)
+        
+    def flags(self, index):
+        """Only the status column is editable"""
+        flags = super().flags(index)
+        if index.column() == self.STATUS_COLUMN:
+            flags |= Qt.ItemIsEditable
+        return flags
+        
+    def setData(self, index, value, role=Qt.EditRole):
+        """Store a status edit through the data manager"""
+        if role != Qt.EditRole or index.column() != self.STATUS_COLUMN:
+            return False
+        return self.set_status(self._ids[index.row()], value)
+        
+    def set_status(self, job_id, status):
+        """Update a job's status, repaint its row and announce the change"""
+        if not self.data_manager.update_job_status(job_id, status):
+            return False
+        self.job_changed(job_id)
+        self.status_changed.emit(job_id, status)
+        return True
+        
+    def sync(self):
+        """Pick up jobs added to or cleared from the data manager"""
+        count = self.data_manager.get_job_count()
+        # Filling an empty table (a new search, a bulk populate) is a reset, so the
+        # sorting proxy sorts the batch once instead of placing rows one at a time
+        if count < self._row_count or (count and not self._row_count):
+            self.beginResetModel()
+            self._row_count = count
+            self.endResetModel()
+        elif count > self._row_count:
+            self.beginInsertRows(QModelIndex(), self._row_count, count - 1)
+            self._row_count = count
+            self.endInsertRows()
+            
+    def reload(self):
+        """Show a job set that replaced the previous one, in one reset"""
+        self.beginResetModel()
+        self._row_count = self.data_manager.get_job_count()
+        self.endResetModel()
+        
+    def job_changed(self, job_id):
+        """Repaint the row of a job updated in place and return that row, or None"""
+        row = self.data_manager.get_row(job_id)
+        if row is None or row >= self._row_count:
+            return None
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+        return row
+
+
+class JobsFilterProxy(QSortFilterProxyModel):
+    """Sorts the jobs and shows only the rows the data manager's filters matched"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # None shows every row
+        self._rows = None
+        
+    def set_rows(self, rows):
+        """Show only the given source rows, or all rows for None"""
+        self._rows = None if rows is None else frozenset(rows)
+        self.invalidateFilter()
+        
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Accept rows in the current match set"""
+        return self._rows is None or source_row in self._rows
+
+
 class MainWindow(QMainWindow):
     """Main application window for LinkedIn Job Scraper"""
     
@@ -111,6 +401,17 @@ class MainWindow(QMainWindow):
         # Initialize data manager
         self.data_manager = JobDataManager()
         self.scraping_worker = None
+        # Created on the first search and kept until the window closes
+        self._scraper = None
+        self._details_dialog = None
+        self._results_cache = ResultsCache()
+        
+        # Coalesce results-search keystrokes into one filter pass after typing pauses
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(config.RESULTS_SEARCH_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.apply_results_filters)
+        
         self.setup_window_properties()
         self.setup_ui()
         self.apply_styling()
@@ -124,6 +425,14 @@ class MainWindow(QMainWindow):
         self.resize(config.DEFAULT_WINDOW_WIDTH, config.DEFAULT_WINDOW_HEIGHT)
         self.setMinimumSize(config.MIN_WINDOW_WIDTH, config.MIN_WINDOW_HEIGHT)
         
+        # Fonts built once and shared by every panel
+        self._fonts = {
+            "title": QFont("Segoe UI", 18, QFont.Bold),
+            "subtitle": QFont("Segoe UI", 10),
+            "section": QFont("Segoe UI", 12, QFont.Bold),
+            "filter": QFont("Segoe UI", 10, QFont.Bold),
+        }
+        
         # Center window on screen
         self.center_on_screen()
         
@@ -215,39 +524,46 @@ class MainWindow(QMainWindow):
         self.progress_label.setText("Preparing to search...")
         self.clear_results_table()
         
+        # Keep one scraper so its browser stays warm between searches
+        if self._scraper is None:
+            self._scraper = LinkedInScraper(headless=True, block_assets=True)
+        
         # Create and start worker thread
         self.scraping_worker = ScrapingWorker(
             job_title=job_title,
             location=location, 
             job_type=job_type,
             experience_level=experience_level,
-            max_pages=3
+            max_pages=3,
+            scraper=self._scraper,
+            cache=self._results_cache
         )
         
         # Connect worker signals
-        self.scraping_worker.progress_update.connect(self.update_scraping_progress)
-        self.scraping_worker.progress_percentage.connect(self.update_progress_percentage)
+        self.scraping_worker.progress.connect(self.update_progress)
         self.scraping_worker.jobs_found.connect(self.handle_jobs_found)
         self.scraping_worker.scraping_finished.connect(self.handle_scraping_finished)
         
         # Start the worker
         self.scraping_worker.start()
     
-    def update_scraping_progress(self, message):
-        """Update the progress message during scraping"""
+    @pyqtSlot(int, str)
+    def update_progress(self, percentage, message):
+        """Update the progress bar and message during scraping"""
         self.statusBar().showMessage(message)
         self.progress_label.setText(message)
-    
-    def update_progress_percentage(self, percentage):
-        """Update the progress bar percentage"""
         self.progress_bar.setValue(percentage)
     
+    @pyqtSlot(list)
     def handle_jobs_found(self, jobs):
-        """Handle jobs found during scraping"""
+        """Handle a page of jobs found during scraping"""
         if jobs:
-            self.populate_results_table(jobs)
-            self.statusBar().showMessage(f"Found {len(jobs)} jobs")
+            # The table was cleared when the search started; add this page to it
+            self.data_manager.add_jobs(jobs)
+            self.refresh_results_table()
+            self.statusBar().showMessage(f"Found {self.data_manager.get_job_count()} jobs")
     
+    @pyqtSlot(bool, str)
     def handle_scraping_finished(self, success, message):
         """Handle scraping completion"""
         # Re-enable search button and hide progress
@@ -298,8 +614,7 @@ class MainWindow(QMainWindow):
         
     def handle_results_search(self):
         """Handle search within results"""
-        search_term = self.results_search_input.text().strip()
-        self.apply_results_filters()
+        self._filter_timer.start()
         
     def handle_results_filter(self):
         """Handle status filter change"""
@@ -307,41 +622,46 @@ class MainWindow(QMainWindow):
         
     def handle_clear_results_filters(self):
         """Handle clear results filters button click"""
+        # Reset quietly so the widgets' own handlers don't filter before the pass below
+        self.results_search_input.blockSignals(True)
+        self.status_filter_combo.blockSignals(True)
         self.results_search_input.clear()
         self.status_filter_combo.setCurrentIndex(0)  # Set to "All Statuses"
+        self.results_search_input.blockSignals(False)
+        self.status_filter_combo.blockSignals(False)
         self.apply_results_filters()
         self.statusBar().showMessage("Results filters cleared")
         
+    def results_filters_active(self):
+        """Whether the results search or status filter is narrowing the table"""
+        return bool(self.results_search_input.text().strip() or
+                    self.status_filter_combo.currentText() != "All Statuses")
+        
     def apply_results_filters(self):
         """Apply current filters and search to the results table"""
-        if self.data_manager.get_job_count() == 0:
-            return
+        # Any pending debounced search is covered by this pass
+        self._filter_timer.stop()
             
         # Get current filter values
         search_term = self.results_search_input.text().strip()
         status_filter = self.status_filter_combo.currentText()
         
-        # Start with all jobs
-        filtered_jobs = self.data_manager.get_all_jobs()
-        
-        # Apply search filter
-        if search_term:
-            filtered_jobs = [job for job in filtered_jobs 
-                           if (search_term.lower() in job.get('title', '').lower() or
-                               search_term.lower() in job.get('company', '').lower() or
-                               search_term.lower() in job.get('description', '').lower())]
-        
-        # Apply status filter
+        # Let the data manager filter its columns directly
+        filters = {'search': search_term}
         if status_filter != "All Statuses":
-            filtered_jobs = [job for job in filtered_jobs 
-                           if job.get('status') == status_filter]
+            filters['status'] = status_filter
         
-        # Update the table with filtered results
-        self.update_results_table_with_filtered_jobs(filtered_jobs)
+        # The proxy hides the other rows; no table rows are rebuilt
+        if search_term or status_filter != "All Statuses":
+            self.jobs_proxy.set_rows(self.data_manager.get_filtered_rows(filters))
+        else:
+            self.jobs_proxy.set_rows(None)
+        if self.data_manager.get_job_count() == 0:
+            return
         
         # Update status bar
         total_jobs = self.data_manager.get_job_count()
-        filtered_count = len(filtered_jobs)
+        filtered_count = self.jobs_proxy.rowCount()
         
         if search_term and status_filter != "All Statuses":
             self.statusBar().showMessage(f"Showing {filtered_count} of {total_jobs} jobs (filtered by search and status)")
@@ -352,71 +672,36 @@ class MainWindow(QMainWindow):
         else:
             self.statusBar().showMessage(f"Showing all {total_jobs} jobs")
             
-    def update_results_table_with_filtered_jobs(self, filtered_jobs):
-        """Update the results table to show only filtered jobs"""
-        # Clear the table
-        self.results_table.setRowCount(0)
-        if hasattr(self, 'row_to_job_id'):
-            self.row_to_job_id.clear()
-        
-        # Add filtered jobs to the table
-        for job_data in filtered_jobs:
-            self.add_job_to_table_without_data_manager(job_data)
-            
-    def add_job_to_table_without_data_manager(self, job_data):
-        """Add a job to the table without adding to data manager (for filtering)"""
-        row_position = self.results_table.rowCount()
-        self.results_table.insertRow(row_position)
-        
-        # Add job data to columns
-        self.results_table.setItem(row_position, 0, QTableWidgetItem(job_data.get('title', '')))
-        self.results_table.setItem(row_position, 1, QTableWidgetItem(job_data.get('company', '')))
-        self.results_table.setItem(row_position, 2, QTableWidgetItem(job_data.get('location', '')))
-        self.results_table.setItem(row_position, 3, QTableWidgetItem(job_data.get('posted_date', '')))
-        
-        # Create status dropdown
-        status_combo = QComboBox()
-        status_combo.setObjectName("statusCombo")
-        status_combo.addItems(self.data_manager.status_options)
-        
-        # Set current status
-        current_status = job_data.get('status', 'Not Reviewed')
-        status_index = status_combo.findText(current_status)
-        if status_index >= 0:
-            status_combo.setCurrentIndex(status_index)
-        
-        # Connect status change signal to data manager
-        job_id = job_data.get('id')
-        status_combo.currentTextChanged.connect(
-            lambda status, job_id=job_id: self.handle_status_change_with_refresh(job_id, status)
-        )
-        
-        # Add status dropdown to table
-        self.results_table.setCellWidget(row_position, 4, status_combo)
-        
-        # Store row to job_id mapping for table operations
-        if not hasattr(self, 'row_to_job_id'):
-            self.row_to_job_id = {}
-        self.row_to_job_id[row_position] = job_id
-        
-    def handle_status_change_with_refresh(self, job_id, new_status):
-        """Handle status change and refresh filters if needed"""
-        # Update status in data manager
-        if self.data_manager.update_job_status(job_id, new_status):
-            # Get updated job data for feedback
-            job_data = self.data_manager.get_job(job_id)
-            if job_data:
-                job_title = job_data.get('title', 'Job')
-                self.statusBar().showMessage(f"Status updated: {job_title} - {new_status}")
+    def refresh_results_table(self, replaced=False):
+        """Show jobs added to (or replaced in) the data manager, respecting the active filters"""
+        self.build_results_view()
+        # Inserting rows and refiltering them are painted once, as one change
+        self.results_table.setUpdatesEnabled(False)
+        try:
+            if replaced:
+                self.jobs_model.reload()
             else:
-                self.statusBar().showMessage(f"Status updated to: {new_status}")
-                
-            # Refresh the filtered view if filters are active
-            if (self.results_search_input.text().strip() or 
-                self.status_filter_combo.currentText() != "All Statuses"):
+                self.jobs_model.sync()
+            if self.results_filters_active():
                 self.apply_results_filters()
+        finally:
+            self.results_table.setUpdatesEnabled(True)
+        
+    @pyqtSlot(object, str)
+    def handle_status_changed(self, job_id, new_status):
+        """Report a stored status change and refresh filters if needed"""
+        row = self.data_manager.get_row(job_id)
+        job_title = self.jobs_model.index(row, 0).data() if row is not None else None
+        if job_title:
+            self.statusBar().showMessage(f"Status updated: {job_title} - {new_status}")
         else:
-            self.statusBar().showMessage("Failed to update job status")
+            self.statusBar().showMessage(f"Status updated to: {new_status}")
+            
+        # The search text is unchanged, so only refilter when the status
+        # filter no longer admits this job
+        status_filter = self.status_filter_combo.currentText()
+        if status_filter != "All Statuses" and status_filter != new_status:
+            self.apply_results_filters()
         
     def create_header(self):
         """Create the application header with title and branding"""
@@ -430,14 +715,12 @@ class MainWindow(QMainWindow):
         # Application title
         title_label = QLabel(config.APP_NAME)
         title_label.setObjectName("titleLabel")
-        title_font = QFont("Segoe UI", 18, QFont.Bold)
-        title_label.setFont(title_font)
+        title_label.setFont(self._fonts["title"])
         
         # Subtitle
         subtitle_label = QLabel("Professional LinkedIn Job Search Tool")
         subtitle_label.setObjectName("subtitleLabel")
-        subtitle_font = QFont("Segoe UI", 10)
-        subtitle_label.setFont(subtitle_font)
+        subtitle_label.setFont(self._fonts["subtitle"])
         
         # Title container
         title_container = QWidget()
@@ -464,8 +747,7 @@ class MainWindow(QMainWindow):
         # Search panel title
         search_title = QLabel("Job Search")
         search_title.setObjectName("sectionTitle")
-        search_title_font = QFont("Segoe UI", 12, QFont.Bold)
-        search_title.setFont(search_title_font)
+        search_title.setFont(self._fonts["section"])
         
         search_layout.addWidget(search_title)
         
@@ -582,20 +864,38 @@ class MainWindow(QMainWindow):
         # Results panel title
         results_title = QLabel("Job Results")
         results_title.setObjectName("sectionTitle")
-        results_title_font = QFont("Segoe UI", 12, QFont.Bold)
-        results_title.setFont(results_title_font)
+        results_title.setFont(self._fonts["section"])
         
         results_layout.addWidget(results_title)
         
+        # The filter panel and table are built with the first results; until then
+        # a single label stands in for them
+        self._results_layout = results_layout
+        self._results_built = False
+        self._results_placeholder = QLabel("Search for jobs to see results here")
+        self._results_placeholder.setObjectName("placeholderText")
+        self._results_placeholder.setAlignment(Qt.AlignCenter)
+        results_layout.addWidget(self._results_placeholder, 1)
+        
+        return results_frame
+        
+    def build_results_view(self):
+        """Replace the placeholder with the filter panel and results table"""
+        if self._results_built:
+            return
+        self._results_built = True
+        
+        self._results_layout.removeWidget(self._results_placeholder)
+        self._results_placeholder.deleteLater()
+        self._results_placeholder = None
+        
         # Create results filtering panel
         filter_panel = self.create_results_filter_panel()
-        results_layout.addWidget(filter_panel)
+        self._results_layout.addWidget(filter_panel)
         
         # Create results table widget
         self.results_table = self.create_results_table()
-        results_layout.addWidget(self.results_table)
-        
-        return results_frame
+        self._results_layout.addWidget(self.results_table)
         
     def create_results_filter_panel(self):
         """Create the results filtering and search panel"""
@@ -610,8 +910,7 @@ class MainWindow(QMainWindow):
         # Search within results
         search_label = QLabel("Search Results:")
         search_label.setObjectName("filterLabel")
-        search_font = QFont("Segoe UI", 10, QFont.Bold)
-        search_label.setFont(search_font)
+        search_label.setFont(self._fonts["filter"])
         
         self.results_search_input = QLineEdit()
         self.results_search_input.setObjectName("resultsSearchInput")
@@ -622,7 +921,7 @@ class MainWindow(QMainWindow):
         # Filter by status
         status_filter_label = QLabel("Status:")
         status_filter_label.setObjectName("filterLabel")
-        status_filter_label.setFont(search_font)
+        status_filter_label.setFont(self._fonts["filter"])
         
         self.status_filter_combo = QComboBox()
         self.status_filter_combo.setObjectName("statusFilterCombo")
@@ -648,19 +947,20 @@ class MainWindow(QMainWindow):
         return filter_frame
         
     def create_results_table(self):
-        """Create and configure the results table widget"""
-        table = QTableWidget()
+        """Create and configure the results table view"""
+        table = QTableView()
         table.setObjectName("resultsTable")
         
-        # Set up columns
-        columns = ["Job Title", "Company", "Location", "Posted Date", "Status"]
-        table.setColumnCount(len(columns))
-        table.setHorizontalHeaderLabels(columns)
+        # Jobs are read from the data manager by the model; the proxy sorts and filters
+        self.jobs_model = JobsTableModel(self.data_manager, self)
+        self.jobs_proxy = JobsFilterProxy(self)
+        self.jobs_proxy.setSourceModel(self.jobs_model)
+        table.setModel(self.jobs_proxy)
         
         # Configure table properties
         table.setAlternatingRowColors(True)
-        table.setSelectionBehavior(QTableWidget.SelectRows)
-        table.setSelectionMode(QTableWidget.SingleSelection)
+        table.setSelectionBehavior(QTableView.SelectRows)
+        table.setSelectionMode(QTableView.SingleSelection)
         table.setSortingEnabled(True)
         table.setShowGrid(False)
         
@@ -674,6 +974,8 @@ class MainWindow(QMainWindow):
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # Location - fit content
         header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # Posted Date - fit content
         header.setSectionResizeMode(4, QHeaderView.Fixed)  # Status - fixed width
+        # Fit content columns to a sample of rows, not every row on each insert
+        header.setResizeContentsPrecision(200)
         
         # Set minimum column widths
         table.setColumnWidth(1, 150)  # Company minimum width
@@ -685,11 +987,16 @@ class MainWindow(QMainWindow):
         table.verticalHeader().setDefaultSectionSize(40)
         table.verticalHeader().setVisible(False)  # Hide row numbers
         
-        # Set initial empty state message
-        table.setRowCount(0)
+        # Status column: a single delegate edits every row; a click on a status
+        # cell opens its dropdown, other cells are read-only
+        self.status_delegate = StatusDelegate(self.data_manager.status_options, table)
+        self.jobs_model.status_changed.connect(self.handle_status_changed)
+        table.setItemDelegateForColumn(JobsTableModel.STATUS_COLUMN, self.status_delegate)
+        table.setEditTriggers(QTableView.NoEditTriggers)
+        table.clicked.connect(self.handle_results_cell_click)
         
         # Connect double-click signal
-        table.cellDoubleClicked.connect(self.handle_job_double_click)
+        table.doubleClicked.connect(self.handle_job_double_click)
         
         return table
         
@@ -698,72 +1005,22 @@ class MainWindow(QMainWindow):
         # Add job to data manager first
         job_id = self.data_manager.add_job(job_data)
         
-        row_position = self.results_table.rowCount()
-        self.results_table.insertRow(row_position)
-        
-        # Add job data to columns
-        self.results_table.setItem(row_position, 0, QTableWidgetItem(job_data.get('title', '')))
-        self.results_table.setItem(row_position, 1, QTableWidgetItem(job_data.get('company', '')))
-        self.results_table.setItem(row_position, 2, QTableWidgetItem(job_data.get('location', '')))
-        self.results_table.setItem(row_position, 3, QTableWidgetItem(job_data.get('posted_date', '')))
-        
-        # Create status dropdown
-        status_combo = QComboBox()
-        status_combo.setObjectName("statusCombo")
-        status_combo.addItems(self.data_manager.status_options)
-        
-        # Set current status from data manager
-        current_job = self.data_manager.get_job(job_id)
-        current_status = current_job.get('status', 'Not Reviewed') if current_job else 'Not Reviewed'
-        status_index = status_combo.findText(current_status)
-        if status_index >= 0:
-            status_combo.setCurrentIndex(status_index)
-        
-        # Connect status change signal to data manager
-        status_combo.currentTextChanged.connect(
-            lambda status, job_id=job_id: self.handle_status_change(job_id, status)
-        )
-        
-        # Add status dropdown to table
-        self.results_table.setCellWidget(row_position, 4, status_combo)
-        
-        # Store row to job_id mapping for table operations
-        if not hasattr(self, 'row_to_job_id'):
-            self.row_to_job_id = {}
-        self.row_to_job_id[row_position] = job_id
+        # A new job becomes a new row; an existing one is repainted in place
+        self.refresh_results_table()
+        self.jobs_model.job_changed(job_id)
         
     def populate_results_table(self, jobs_list):
         """Populate the table with a list of jobs"""
-        # Clear existing data
-        self.clear_results_table()
-        
-        # Add jobs to data manager first
-        self.data_manager.add_jobs(jobs_list)
-        
-        # Add each job to the table
-        for job_data in jobs_list:
-            self.add_job_to_table(job_data)
+        # Swap the jobs in one go; the table model reloads once instead of
+        # resetting for the clear and again for the new rows
+        self.data_manager.replace_jobs(jobs_list)
+        self.refresh_results_table(replaced=True)
             
     def clear_results_table(self):
         """Clear all data from the results table"""
-        self.results_table.setRowCount(0)
         self.data_manager.clear_data()
-        if hasattr(self, 'row_to_job_id'):
-            self.row_to_job_id.clear()
-            
-    def handle_status_change(self, job_id, new_status):
-        """Handle status dropdown change for a job"""
-        # Update status in data manager
-        if self.data_manager.update_job_status(job_id, new_status):
-            # Get updated job data for feedback
-            job_data = self.data_manager.get_job(job_id)
-            if job_data:
-                job_title = job_data.get('title', 'Job')
-                self.statusBar().showMessage(f"Status updated: {job_title} - {new_status}")
-            else:
-                self.statusBar().showMessage(f"Status updated to: {new_status}")
-        else:
-            self.statusBar().showMessage("Failed to update job status")
+        if self._results_built:
+            self.jobs_model.sync()
             
     def get_all_jobs_data(self):
         """Get all job data including current status for export"""
@@ -771,53 +1028,38 @@ class MainWindow(QMainWindow):
         
     def add_sample_data(self):
         """Add sample job data to demonstrate table functionality"""
-        sample_jobs = [
-            {
-                'id': 'job_1',
-                'title': 'Senior Software Engineer',
-                'company': 'Tech Corp',
-                'location': 'San Francisco, CA',
-                'posted_date': '2 days ago',
-                'status': 'Not Reviewed',
-                'description': 'We are looking for a senior software engineer...',
-                'url': 'https://linkedin.com/jobs/sample1'
-            },
-            {
-                'id': 'job_2', 
-                'title': 'Data Scientist',
-                'company': 'Analytics Inc',
-                'location': 'New York, NY',
-                'posted_date': '1 week ago',
-                'status': 'Interested',
-                'description': 'Join our data science team...',
-                'url': 'https://linkedin.com/jobs/sample2'
-            },
-            {
-                'id': 'job_3',
-                'title': 'Product Manager',
-                'company': 'StartupXYZ',
-                'location': 'Remote',
-                'posted_date': '3 days ago', 
-                'status': 'Applied',
-                'description': 'Lead product development...',
-                'url': 'https://linkedin.com/jobs/sample3'
-            }
-        ]
-        
-        self.populate_results_table(sample_jobs)
+        self.populate_results_table([dict(job) for job in SAMPLE_JOBS])
         
-    def handle_job_double_click(self, row, column):
-        """Handle double-click on job row to show details"""
-        if hasattr(self, 'row_to_job_id') and row in self.row_to_job_id:
-            job_id = self.row_to_job_id[row]
-            job_data = self.data_manager.get_job(job_id)
-            if job_data:
-                self.show_job_details(job_data)
+    @pyqtSlot(QModelIndex)
+    def handle_results_cell_click(self, index):
+        """Open the status dropdown when a status cell is clicked"""
+        if index.column() == JobsTableModel.STATUS_COLUMN:
+            self.results_table.edit(index)
             
+    @pyqtSlot(QModelIndex)
+    def handle_job_double_click(self, index):
+        """Handle double-click on job row to show details"""
+        job_data = index.data(JobsTableModel.JOB_ROLE)
+        if job_data:
+            self.show_job_details(job_data)
+            
+    def closeEvent(self, event):
+        """Release the scraper's browser and the results cache when the window closes"""
+        # Don't pull the driver out from under a search that is still running
+        if self._scraper and not (self.scraping_worker and self.scraping_worker.isRunning()):
+            self._scraper.cleanup()
+        # A search still running reopens the cache if it writes to it
+        self._results_cache.close()
+        super().closeEvent(event)
+        
     def show_job_details(self, job_data):
         """Show job details in a popup dialog"""
-        dialog = JobDetailsDialog(job_data, self)
-        dialog.exec_()
+        # One dialog is kept and refilled for each job shown
+        if self._details_dialog is None:
+            self._details_dialog = JobDetailsDialog(job_data, self)
+        else:
+            self._details_dialog.update_job(job_data)
+        self._details_dialog.exec_()
         
     def setup_status_bar(self):
         """Create and configure the status bar"""
@@ -832,402 +1074,30 @@ class MainWindow(QMainWindow):
     def apply_styling(self):
         """Apply professional color scheme and styling"""
         # Main window styling
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {config.COLORS['background']};
-            }}
-            
-            /* Header Styling */
-            #headerFrame {{
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 {config.COLORS['primary']}, 
-                    stop: 1 #005885);
-                border: none;
-                border-bottom: 2px solid {config.COLORS['accent']};
-            }}
-            
-            #titleLabel {{
-                color: {config.COLORS['secondary']};
-                background: transparent;
-            }}
-            
-            #subtitleLabel {{
-                color: #E6F3FF;
-                background: transparent;
-            }}
-            
-            /* Section Titles */
-            #sectionTitle {{
-                color: {config.COLORS['text']};
-                background: transparent;
-                padding: 5px 0px;
-                border-bottom: 2px solid {config.COLORS['accent']};
-                margin-bottom: 10px;
-            }}
-            
-            /* Panel Styling */
-            #searchFrame {{
-                background-color: {config.COLORS['secondary']};
-                border: 1px solid {config.COLORS['border']};
-                border-radius: 8px;
-                margin: 10px;
-            }}
-            
-            #resultsFrame {{
-                background-color: {config.COLORS['secondary']};
-                border: 1px solid {config.COLORS['border']};
-                border-radius: 8px;
-                margin: 10px;
-            }}
-            
-            /* Status Bar */
-            #statusBar {{
-                background-color: {config.COLORS['background']};
-                border-top: 1px solid {config.COLORS['border']};
-                color: {config.COLORS['text']};
-                padding: 5px;
-            }}
-            
-            /* Placeholder Text */
-            #placeholderText {{
-                color: #999999;
-                font-size: 11px;
-            }}
-            
-            /* Input Field Styling */
-            #inputLabel {{
-                color: {config.COLORS['text']};
-                font-weight: bold;
-                font-size: 11px;
-                padding: 5px 0px;
-            }}
-            
-            QLineEdit {{
-                padding: 8px 12px;
-                border: 2px solid {config.COLORS['border']};
-                border-radius: 6px;
-                background-color: {config.COLORS['secondary']};
-                color: {config.COLORS['text']};
-                font-size: 11px;
-                min-height: 20px;
-            }}
-            
-            QLineEdit:focus {{
-                border-color: {config.COLORS['primary']};
-                background-color: #F8FBFF;
-            }}
-            
-            QLineEdit:hover {{
-                border-color: {config.COLORS['accent']};
-            }}
-            
-            /* ComboBox Styling */
-            QComboBox {{
-                padding: 8px 12px;
-                border: 2px solid {config.COLORS['border']};
-                border-radius: 6px;
-                background-color: {config.COLORS['secondary']};
-                color: {config.COLORS['text']};
-                font-size: 11px;
-                min-height: 20px;
-                min-width: 120px;
-            }}
-            
-            QComboBox:focus {{
-                border-color: {config.COLORS['primary']};
-                background-color: #F8FBFF;
-            }}
-            
-            QComboBox:hover {{
-                border-color: {config.COLORS['accent']};
-            }}
-            
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid {config.COLORS['text']};
-                margin-right: 5px;
-            }}
-            
-            QComboBox QAbstractItemView {{
-                border: 2px solid {config.COLORS['border']};
-                background-color: {config.COLORS['secondary']};
-                selection-background-color: {config.COLORS['accent']};
-                selection-color: {config.COLORS['secondary']};
-            }}
-            
-            /* Button Styling */
-            QPushButton {{
-                padding: 10px 20px;
-                border: none;
-                border-radius: 6px;
-                font-size: 11px;
-                font-weight: bold;
-                min-width: 100px;
-            }}
-            
-            #searchButton {{
-                background-color: {config.COLORS['primary']};
-                color: {config.COLORS['secondary']};
-            }}
-            
-            #searchButton:hover {{
-                background-color: #005885;
-            }}
-            
-            #searchButton:pressed {{
-                background-color: #004466;
-            }}
-            
-            #clearButton {{
-                background-color: #F5F5F5;
-                color: {config.COLORS['text']};
-                border: 2px solid {config.COLORS['border']};
-            }}
-            
-            #clearButton:hover {{
-                background-color: #E8E8E8;
-                border-color: {config.COLORS['accent']};
-            }}
-            
-            #clearButton:pressed {{
-                background-color: #DDDDDD;
-            }}
-            
-            /* Splitter Styling */
-            QSplitter::handle {{
-                background-color: {config.COLORS['border']};
-                height: 2px;
-            }}
-            
-            QSplitter::handle:hover {{
-                background-color: {config.COLORS['accent']};
-            }}
-            
-            /* Results Table Styling */
-            #resultsTable {{
-                background-color: {config.COLORS['secondary']};
-                border: 1px solid {config.COLORS['border']};
-                border-radius: 6px;
-                gridline-color: {config.COLORS['border']};
-                selection-background-color: #E6F3FF;
-                selection-color: {config.COLORS['text']};
-                font-size: 11px;
-            }}
-            
-            #resultsTable::item {{
-                padding: 8px;
-                border-bottom: 1px solid #F0F0F0;
-            }}
-            
-            #resultsTable::item:selected {{
-                background-color: #E6F3FF;
-                color: {config.COLORS['text']};
-            }}
-            
-            #resultsTable::item:hover {{
-                background-color: #F8FBFF;
-            }}
-            
-            /* Table Header Styling */
-            #resultsTable QHeaderView::section {{
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #F8F9FA, stop: 1 #E9ECEF);
-                border: 1px solid {config.COLORS['border']};
-                border-left: none;
-                border-right: none;
-                padding: 8px 12px;
-                font-weight: bold;
-                font-size: 11px;
-                color: {config.COLORS['text']};
-            }}
-            
-            #resultsTable QHeaderView::section:first {{
-                border-left: 1px solid {config.COLORS['border']};
-                border-top-left-radius: 6px;
-            }}
-            
-            #resultsTable QHeaderView::section:last {{
-                border-right: 1px solid {config.COLORS['border']};
-                border-top-right-radius: 6px;
-            }}
-            
-            #resultsTable QHeaderView::section:hover {{
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #E6F3FF, stop: 1 #CCE7FF);
-            }}
-            
-            /* Alternating row colors */
-            #resultsTable::item:alternate {{
-                background-color: #FAFBFC;
-            }}
-            
-            /* Progress Bar Styling */
-            #progressBar {{
-                border: 2px solid {config.COLORS['border']};
-                border-radius: 6px;
-                background-color: {config.COLORS['secondary']};
-                text-align: center;
-                font-size: 10px;
-                font-weight: bold;
-                color: {config.COLORS['text']};
-                min-height: 20px;
-            }}
-            
-            #progressBar::chunk {{
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 {config.COLORS['primary']}, 
-                    stop: 1 #005885);
-                border-radius: 4px;
-                margin: 1px;
-            }}
-            
-            /* Progress Label Styling */
-            #progressLabel {{
-                color: {config.COLORS['text']};
-                font-size: 10px;
-                font-style: italic;
-                padding: 2px 0px;
-                margin-top: 5px;
-            }}
-            
-            /* Status ComboBox in Table */
-            #statusCombo {{
-                border: 1px solid {config.COLORS['border']};
-                border-radius: 4px;
-                padding: 4px 8px;
-                background-color: {config.COLORS['secondary']};
-                font-size: 10px;
-                min-height: 16px;
-            }}
-            
-            #statusCombo:focus {{
-                border-color: {config.COLORS['primary']};
-            }}
-            
-            #statusCombo::drop-down {{
-                border: none;
-                width: 16px;
-            }}
-            
-            #statusCombo::down-arrow {{
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid {config.COLORS['text']};
-                margin-right: 3px;
-            }}
-            
-            #statusCombo QAbstractItemView {{
-                border: 1px solid {config.COLORS['border']};
-                background-color: {config.COLORS['secondary']};
-                selection-background-color: {config.COLORS['accent']};
-                selection-color: {config.COLORS['secondary']};
-                font-size: 10px;
-            }}
-            
-            /* Results Filter Panel Styling */
-            #resultsFilterFrame {{
-                background-color: #F8F9FA;
-                border: 1px solid {config.COLORS['border']};
-                border-radius: 6px;
-                margin-bottom: 10px;
-            }}
-            
-            #filterLabel {{
-                color: {config.COLORS['text']};
-                font-size: 10px;
-                font-weight: bold;
-            }}
-            
-            #resultsSearchInput {{
-                padding: 6px 10px;
-                border: 2px solid {config.COLORS['border']};
-                border-radius: 4px;
-                background-color: {config.COLORS['secondary']};
-                color: {config.COLORS['text']};
-                font-size: 10px;
-                min-height: 16px;
-            }}
-            
-            #resultsSearchInput:focus {{
-                border-color: {config.COLORS['primary']};
-                background-color: #F8FBFF;
-            }}
-            
-            #statusFilterCombo {{
-                padding: 6px 10px;
-                border: 2px solid {config.COLORS['border']};
-                border-radius: 4px;
-                background-color: {config.COLORS['secondary']};
-                color: {config.COLORS['text']};
-                font-size: 10px;
-                min-height: 16px;
-            }}
-            
-            #statusFilterCombo:focus {{
-                border-color: {config.COLORS['primary']};
-                background-color: #F8FBFF;
-            }}
-            
-            #statusFilterCombo::drop-down {{
-                border: none;
-                width: 18px;
-            }}
-            
-            #statusFilterCombo::down-arrow {{
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid {config.COLORS['text']};
-                margin-right: 4px;
-            }}
-            
-            #statusFilterCombo QAbstractItemView {{
-                border: 2px solid {config.COLORS['border']};
-                background-color: {config.COLORS['secondary']};
-                selection-background-color: {config.COLORS['accent']};
-                selection-color: {config.COLORS['secondary']};
-                font-size: 10px;
-            }}
-            
-            #clearResultsFiltersButton {{
-                background-color: #F5F5F5;
-                color: {config.COLORS['text']};
-                border: 2px solid {config.COLORS['border']};
-                padding: 6px 12px;
-                border-radius: 4px;
-                font-size: 10px;
-                font-weight: bold;
-                min-height: 16px;
-            }}
-            
-            #clearResultsFiltersButton:hover {{
-                background-color: #E8E8E8;
-                border-color: {config.COLORS['accent']};
-            }}
-            
-            #clearResultsFiltersButton:pressed {{
-                background-color: #DDDDDD;
-            }}
-        """)
+        self.setStyleSheet(MAIN_STYLESHEET)
 
 
 class JobDetailsDialog(QDialog):
     """Dialog for displaying detailed job information"""
     
+    # Fonts shared by every dialog; built when the first one opens
+    _fonts = None
+    
     def __init__(self, job_data, parent=None):
         super().__init__(parent)
         self.job_data = job_data
+        # Text already laid out in the description box, so reopening a job skips the layout
+        self._description = None
+        # Set while only a preview of a long description is shown
+        self._full_description = None
         self.setup_dialog()
         self.populate_data()
         
+    def update_job(self, job_data):
+        """Show another job in this dialog instead of building a new one"""
+        self.job_data = job_data
+        self.populate_data()
+        
     def setup_dialog(self):
         """Set up the dialog window and layout"""
         self.setWindowTitle("Job Details")
@@ -1235,6 +1105,14 @@ class JobDetailsDialog(QDialog):
         self.resize(600, 500)
         self.setMinimumSize(500, 400)
         
+        if JobDetailsDialog._fonts is None:
+            JobDetailsDialog._fonts = {
+                "title": QFont("Segoe UI", 16, QFont.Bold),
+                "company": QFont("Segoe UI", 12),
+                "location": QFont("Segoe UI", 10),
+                "section": QFont("Segoe UI", 11, QFont.Bold),
+            }
+        
         # Create main layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -1248,19 +1126,16 @@ class JobDetailsDialog(QDialog):
         
         self.title_label = QLabel()
         self.title_label.setObjectName("jobDetailsTitle")
-        title_font = QFont("Segoe UI", 16, QFont.Bold)
-        self.title_label.setFont(title_font)
+        self.title_label.setFont(self._fonts["title"])
         self.title_label.setWordWrap(True)
         
         self.company_label = QLabel()
         self.company_label.setObjectName("jobDetailsCompany")
-        company_font = QFont("Segoe UI", 12)
-        self.company_label.setFont(company_font)
+        self.company_label.setFont(self._fonts["company"])
         
         self.location_label = QLabel()
         self.location_label.setObjectName("jobDetailsLocation")
-        location_font = QFont("Segoe UI", 10)
-        self.location_label.setFont(location_font)
+        self.location_label.setFont(self._fonts["location"])
         
         header_layout.addWidget(self.title_label)
         header_layout.addWidget(self.company_label)
@@ -1271,20 +1146,20 @@ class JobDetailsDialog(QDialog):
         # Job description
         desc_label = QLabel("Job Description:")
         desc_label.setObjectName("sectionLabel")
-        desc_font = QFont("Segoe UI", 11, QFont.Bold)
-        desc_label.setFont(desc_font)
+        desc_label.setFont(self._fonts["section"])
         layout.addWidget(desc_label)
         
         self.description_text = QTextEdit()
         self.description_text.setObjectName("jobDescription")
         self.description_text.setReadOnly(True)
         self.description_text.setMaximumHeight(200)
+        self.description_text.verticalScrollBar().valueChanged.connect(self.load_full_description)
         layout.addWidget(self.description_text)
         
         # Job details
         details_label = QLabel("Details:")
         details_label.setObjectName("sectionLabel")
-        details_label.setFont(desc_font)
+        details_label.setFont(self._fonts["section"])
         layout.addWidget(details_label)
         
         details_frame = QFrame()
@@ -1338,12 +1213,31 @@ class JobDetailsDialog(QDialog):
         self.company_label.setText(self.job_data.get('company', 'No Company'))
         self.location_label.setText(self.job_data.get('location', 'No Location'))
         
-        description = self.job_data.get('description', 'No description available.')
-        self.description_text.setPlainText(description)
-        
+        description = self.job_data.get('description') or 'No description available.'
+        if description != self._description:
+            self._description = description
+            # Long descriptions open as a preview; the box holds about a dozen lines
+            if len(description) > DESCRIPTION_PREVIEW_CHARS:
+                self._full_description = description
+                self.description_text.setPlainText(description[:DESCRIPTION_PREVIEW_CHARS] + "\n… [scroll for more]")
+            else:
+                self._full_description = None
+                self.description_text.setPlainText(description)
+                
         self.posted_value.setText(self.job_data.get('posted_date', 'Unknown'))
         self.status_value.setText(self.job_data.get('status', 'Not Reviewed'))
         
+    @pyqtSlot(int)
+    def load_full_description(self, value):
+        """Swap in the whole description once the preview is scrolled to the end"""
+        scroll_bar = self.description_text.verticalScrollBar()
+        if self._full_description is None or value < scroll_bar.maximum():
+            return
+        full_description, self._full_description = self._full_description, None
+        self.description_text.setPlainText(full_description)
+        scroll_bar.setValue(value)
+        
+    @pyqtSlot()
     def open_linkedin_url(self):
         """Open the LinkedIn job posting in the default browser"""
         url = self.job_data.get('url', '')
@@ -1355,97 +1249,4 @@ class JobDetailsDialog(QDialog):
             
     def apply_dialog_styling(self):
         """Apply styling to the dialog"""
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {config.COLORS['background']};
-            }}
-            
-            #jobDetailsHeader {{
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 {config.COLORS['primary']}, 
-                    stop: 1 #005885);
-                border-radius: 8px;
-                margin-bottom: 10px;
-            }}
-            
-            #jobDetailsTitle {{
-                color: {config.COLORS['secondary']};
-                background: transparent;
-            }}
-            
-            #jobDetailsCompany {{
-                color: #E6F3FF;
-                background: transparent;
-            }}
-            
-            #jobDetailsLocation {{
-                color: #CCE7FF;
-                background: transparent;
-            }}
-            
-            #sectionLabel {{
-                color: {config.COLORS['text']};
-                padding: 5px 0px;
-                border-bottom: 2px solid {config.COLORS['accent']};
-                margin-bottom: 5px;
-            }}
-            
-            #jobDescription {{
-                border: 2px solid {config.COLORS['border']};
-                border-radius: 6px;
-                background-color: {config.COLORS['secondary']};
-                color: {config.COLORS['text']};
-                font-size: 11px;
-                padding: 10px;
-            }}
-            
-            #detailLabel {{
-                color: {config.COLORS['text']};
-                font-weight: bold;
-                font-size: 11px;
-            }}
-            
-            #detailValue {{
-                color: {config.COLORS['text']};
-                font-size: 11px;
-            }}
-            
-            #linkedinButton {{
-                background-color: {config.COLORS['primary']};
-                color: {config.COLORS['secondary']};
-                padding: 10px 20px;
-                border: none;
-                border-radius: 6px;
-                font-size: 11px;
-                font-weight: bold;
-                min-width: 120px;
-            }}
-            
-            #linkedinButton:hover {{
-                background-color: #005885;
-            }}
-            
-            #linkedinButton:pressed {{
-                background-color: #004466;
-            }}
-            
-            #closeButton {{
-                background-color: #F5F5F5;
-                color: {config.COLORS['text']};
-                border: 2px solid {config.COLORS['border']};
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-size: 11px;
-                font-weight: bold;
-                min-width: 80px;
-            }}
-            
-            #closeButton:hover {{
-                background-color: #E8E8E8;
-                border-color: {config.COLORS['accent']};
-            }}
-            
-            #closeButton:pressed {{
-                background-color: #DDDDDD;
-            }}
-        """)
\ No newline at end of file
+        self.setStyleSheet(DIALOG_STYLESHEET)
\ No newline at end of file